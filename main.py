@@ -6,35 +6,67 @@ Author: Rafael Mandel
 Version: 1.0.0
 """
 
-from ntpath import exists
 import sys
 import os
-import tkinter as tk
-from tkinter import messagebox 
+import importlib
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Required
-from unittest import result
 
 # Add the projetct root to python path
+#(com `python main.py` o diretorio do script ja e sys.path[0]; so entra se faltar,
+#por exemplo quando main e importado de outro lugar)
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root)) #trocar depois
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-try:
-    from views.main_window import MouseManagerGUI
-    from modules.mouse_detector import MouseDetector
-    from modules.system_settings import SystemMouseSettings
-except ImportError as e:
-    print(f"Import error: {e}")
-    print("Certifique-se de que todos os arquios estao no local certo")
-    sys.exit(1)
+#modulos pesados (tkinter, GUI, HID) so sao importados quando usados (PEP 562)
+_LAZY = {
+    "MouseManagerGUI": "views.main_window",
+    "MouseDetector": "modules.mouse_detector",
+    "SystemMouseSettings": "modules.system_settings",
+}
+
+
+def _lazy(name):
+    """Importa sob demanda um dos nomes de _LAZY e guarda no modulo"""
+    obj = globals().get(name)
+    if obj is not None:
+        return obj
     
+    try:
+        module = importlib.import_module(_LAZY[name])
+    except ImportError as e:
+        print(f"Import error: {e}")
+        print("Certifique-se de que todos os arquios estao no local certo")
+        sys.exit(1)
+        
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __getattr__(name):
+    """Resolve os imports preguicosos no acesso ao atributo do modulo"""
+    if name in _LAZY:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+#permite ao CI pegar imports quebrados que so falhariam em tempo de uso
+if os.environ.get("MOUSE_MANAGER_EAGER_IMPORT"):
+    for _name in _LAZY:
+        _lazy(_name)
+    
+
 
 class MouseManagerApp:
     
     def __init__(self):
         self.root = None
         self.gui = None
+        self._log_listener = None
         self.setup_logging()
         self.check_requirements()
         
@@ -47,13 +79,23 @@ class MouseManagerApp:
             
             #configura logging
             log_file = log_dir / "mouse_manager.log"
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            target_handlers = [
+                logging.FileHandler(log_file, encoding='utf-8'),
+                logging.StreamHandler(sys.stdout)
+            ]
+            for handler in target_handlers:
+                handler.setFormatter(formatter)
+                
+            #a escrita em disco fica numa thread separada, a thread da GUI so faz queue.put
+            log_queue = queue.Queue(-1)
+            self._log_listener = QueueListener(log_queue, *target_handlers,
+                                               respect_handler_level=True)
+            self._log_listener.start()
+            
             logging.basicConfig(
                 level=logging.INFO,
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                handlers=[
-                    logging.FileHandler(log_file, encoding='utf-8'),
-                    logging.StreamHandler(sys.stdout)
-                ]
+                handlers=[QueueHandler(log_queue)]
             )
             
             self.logger = logging.getLogger(__name__)
@@ -62,7 +104,7 @@ class MouseManagerApp:
         except Exception as e:
             print(f"Erro ao configurar logging: {e}")
             #configuracao basica de fallback
-            logging.basicCOnfig(level=logging.INFO)
+            logging.basicConfig(level=logging.INFO)
             self.logger = logging.getLogger(__name__)
             
     def check_requirements(self):
@@ -87,8 +129,8 @@ class MouseManagerApp:
                 self.logger.error(error_msg)
                 raise ImportError(error_msg)
             
-            #verifica permissoes
-            self.check_permissions()
+            #a verificacao de permissoes (varredura HID) roda depois que a GUI abre,
+            #ver check_permissions
             
             self.logger.info("Todos os requisitos estão atendidos.")
             
@@ -97,24 +139,30 @@ class MouseManagerApp:
             raise
         
     def check_permissions(self):
-        """Verifica se a aplicação tem as permissões necessárias"""
+        """Agenda a verificacao de permissoes fora do caminho de inicializacao"""
+        #usa as instancias da GUI e o pool dela (serializado com as gravacoes); a
+        #varredura HID fica so com a thread de deteccao, que ja reporta as falhas
+        if self.gui is None:
+            return
+        self.gui._pool.submit(self._probe_permissions)
+        
+    def _probe_permissions(self):
+        """Verifica se a aplicação tem as permissões necessárias (roda no pool da GUI)"""
         try:
-            #testar acesso aos modulos principais
-            detector = MouseDetector()
-            settings = SystemMouseSettings()
-            
             #testar operacoes basicas
-            detector.get_connected_mice()
-            settings.get_mouse_speed()
+            self.gui.system_settings.get_mouse_speed()
             
             self.logger.info("Permissoes verificadas com sucesso")
             
         except Exception as e:
+            #nao interromper a execucao, apenas avisar; o logging e thread-safe (vai
+            #pela QueueHandler), entao nada aqui toca no tk fora da thread dele
             self.logger.warning(f"Possivel problema de permissoes: {e}")
-            #nao interromper a execucao, apenas avisar
             
     def create_gui(self):
         """Cria e configura a interface grafica"""
+        import tkinter as tk
+        
         try:
             self.root = tk.Tk()
             
@@ -130,10 +178,13 @@ class MouseManagerApp:
             self.setup_theme()
             
             #cria a gui princiapl
-            self.gui = MouseManagerGUI(self.root)
+            self.gui = _lazy("MouseManagerGUI")(self.root)
+            
+            #verifica permissoes so depois que o mainloop ja estiver rodando
+            self.root.after(100, self.check_permissions)
             
             #configura eventos de fechamento
-            self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+            self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
             
             self.logger.info("Interface grafica criada com sucesso")
             
@@ -193,6 +244,8 @@ class MouseManagerApp:
             
     def show_welcome_message(self):
         """Mostra mensagem de boas vindas (fica legal e vai criar a porra toda se ja nao tiver criado)"""
+        from tkinter import messagebox
+        
         try:
             #verificar se a primeira execucao
             config_file = project_root / "config" / "first_run.flag"
@@ -228,6 +281,8 @@ class MouseManagerApp:
         """Mostra dialogo de error"""
         try:
             if self.root:
+                from tkinter import messagebox
+
                 messagebox.showerror(title, message)
             else:
                 print(f"ERRO - {title}: {message}")
@@ -239,10 +294,6 @@ class MouseManagerApp:
         try:
             self.logger.info("Fechando aplicacao...")
             
-            #salvar configuracoes se necessario
-            if self.gui:
-                self.gui.save_settings_on_exit()
-                
             #confirmar fechamento se houver alterracoes nao salvas
             if self.confirm_exit():
                 self.cleanup()
@@ -254,21 +305,22 @@ class MouseManagerApp:
             
     def confirm_exit(self):
         """Confirma se o user deseja sair"""
+        from tkinter import messagebox
+        
         try:
             if self.gui.has_unsaved_changes():
                 result = messagebox.askyesno(
                     "Confirmar Saída", 
-                    "Você tem alterações não salvas.\n\n", 
-                    "Deseja sair?"
+                    "Você tem alterações não salvas.\n\n"
+                    "Deseja salvar antes de sair?"
                 )
                 
                 if result is True: #sim ne burrao - salvar e sair
                     self.gui.save_all_settings()
                     return True
-                elif result is False: #não - apenas sair
-                    return False
-                else: #cancelar
-                    return False
+                else: #não - apenas sair
+                    self.gui.discard_pending_changes()
+                    return True
                 
             return True
         
@@ -288,6 +340,11 @@ class MouseManagerApp:
             #salvar logs finais
             self.logger.info("Mouse Manager finalizado")
             
+            #descarrega os registros pendentes na fila antes de sair
+            if self._log_listener:
+                self._log_listener.stop()
+                self._log_listener = None
+            
         except Exception as e:
             self.logger.error(f"Erro durante limpeza: {e}")
             
@@ -307,6 +364,9 @@ def main():
         
         #tentar mostrar erro em gui (se eu conseguir)
         try:
+            import tkinter as tk
+            from tkinter import messagebox
+            
             root = tk.Tk()
             root.withdraw() #para esconder a janel
             messagebox.showerror(
@@ -0,0 +1,22 @@
+"""
+Pacote com os modulos de deteccao e configuracao de mouses
+Os submodulos so sao importados quando um nome e acessado (PEP 562)
+"""
+
+import importlib
+
+_LAZY = {
+    "MouseInfo": "modules.mouse_detector",
+    "MouseDetector": "modules.mouse_detector",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Importa o submodulo correspondente no primeiro acesso ao nome"""
+    if name in _LAZY:
+        obj = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
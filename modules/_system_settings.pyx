@@ -0,0 +1,78 @@
+# cython: language_level=3
+# distutils: libraries = user32
+"""
+Extensao Cython com as chamadas Win32 de configuracao do mouse
+Le as configuracoes com SystemParametersInfoW & cia diretamente, sem o marshalling
+do ctypes; a escrita continua no ctypes (SystemMouseSettings)
+Compilar com: pip install cython && cythonize -i modules/_system_settings.pyx
+Versao: 1.0.0
+"""
+
+cdef extern from "windows.h" nogil:
+    ctypedef unsigned int UINT
+    ctypedef int BOOL
+    ctypedef void* PVOID
+
+    BOOL SystemParametersInfoW(UINT uiAction, UINT uiParam, PVOID pvParam, UINT fWinIni)
+    UINT GetDoubleClickTime()
+    int GetSystemMetrics(int nIndex)
+
+#Constantes do Windows (mesmos valores de SystemMouseSettings)
+cdef enum:
+    SPI_GETMOUSE = 0x0003
+    SPI_GETMOUSEBUTTONSWAP = 0x0016
+    SPI_GETWHEELSCROLLLINES = 0x0068
+    SPI_GETMOUSEHOVERTIME = 0x0066
+    SPI_GETMOUSESPEED = 0x0070
+    SM_CXDRAG = 68
+    SM_CYDRAG = 69
+
+
+cdef struct MouseSettingsC:
+    int speed
+    int accel[3]
+    UINT double_click_speed
+    BOOL swap_buttons
+    UINT wheel_scroll_lines
+    UINT hover_time
+    int drag_width
+    int drag_height
+
+
+cdef class SystemMouseSettingsC:
+    """
+    Leitura das configuracoes do mouse em C
+    Os valores brutos sao devolvidos para SystemMouseSettings validar e montar o MouseSettings
+    """
+
+    def read_all(self):
+        """
+        Le todas as configuracoes em uma unica passada, sem a GIL
+
+        Returns:
+            tuple: (speed, (threshold1, threshold2, acceleration), double_click_speed,
+                    swap_buttons, wheel_scroll_lines, hover_time, (drag_width, drag_height))
+                   com None nos campos cuja leitura falhou
+        """
+        cdef MouseSettingsC s
+        cdef BOOL ok_speed, ok_accel, ok_swap, ok_lines, ok_hover
+
+        with nogil:
+            ok_speed = SystemParametersInfoW(SPI_GETMOUSESPEED, 0, &s.speed, 0)
+            ok_accel = SystemParametersInfoW(SPI_GETMOUSE, 0, s.accel, 0)
+            ok_swap = SystemParametersInfoW(SPI_GETMOUSEBUTTONSWAP, 0, &s.swap_buttons, 0)
+            ok_lines = SystemParametersInfoW(SPI_GETWHEELSCROLLLINES, 0, &s.wheel_scroll_lines, 0)
+            ok_hover = SystemParametersInfoW(SPI_GETMOUSEHOVERTIME, 0, &s.hover_time, 0)
+            s.double_click_speed = GetDoubleClickTime()
+            s.drag_width = GetSystemMetrics(SM_CXDRAG)
+            s.drag_height = GetSystemMetrics(SM_CYDRAG)
+
+        return (
+            s.speed if ok_speed else None,
+            (s.accel[0], s.accel[1], s.accel[2]) if ok_accel else None,
+            s.double_click_speed,
+            bool(s.swap_buttons) if ok_swap else None,
+            s.wheel_scroll_lines if ok_lines else None,
+            s.hover_time if ok_hover else None,
+            (s.drag_width, s.drag_height),
+        )
@@ -6,13 +6,29 @@ Versao: 1.0.0
 
 import hid
 import re
+import sys
 import time
+import operator
+import functools
+import threading
+import weakref
+from collections import defaultdict
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
-@dataclass
+from . import system_events
+
+__all__ = ['MouseInfo', 'MouseDetector']
+
+@dataclass(frozen=True)
 class MouseInfo:
     """Classe de dados para informacoes do mouse"""
+    #__slots__ declarado a mao (e nao dataclass(slots=True), que so existe a partir do
+    #3.10): uma instancia por dispositivo, sem __dict__, em qualquer versao suportada
+    __slots__ = ('name', 'manufacturer', 'vendor_id', 'product_id', 'connection_type',
+                 'serial_number', 'path', 'interface_number', 'release_number',
+                 'usage_page', 'usage', 'name_lc')
+    
     name: str
     manufacturer: str
     vendor_id: str
@@ -25,6 +41,90 @@ class MouseInfo:
     usage_page: int
     usage: int
     
+    def __post_init__(self):
+        #nome em minusculas calculado uma vez, usado como chave de ordenacao
+        #(so um slot, nao um campo: fica fora de repr, eq, hash e fields())
+        object.__setattr__(self, 'name_lc', self.name.lower())
+    
+    #frozen + __slots__ sem __dict__: o copy/pickle padrao restauraria os slots com
+    #setattr (FrozenInstanceError), entao o estado vai e volta como tupla dos campos
+    def __getstate__(self):
+        return tuple(getattr(self, f.name) for f in fields(self))
+    
+    def __setstate__(self, state):
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+        self.__post_init__()
+    
+
+class _DeviceChangeMonitor:
+    """
+    Observa mudancas de topologia de dispositivos (conectar/desconectar)
+    Uma unica thread por processo marca como sujo o cache de todos os detectores
+    """
+    
+    #Constantes do Windows para notificacao de dispositivos (wparam de WM_DEVICECHANGE)
+    DBT_DEVNODES_CHANGED = 0x0007
+    DBT_DEVICEARRIVAL = 0x8000
+    DBT_DEVICEREMOVECOMPLETE = 0x8004
+    
+    def __init__(self):
+        self.detectors = weakref.WeakSet()
+        self.active = False
+        self._started = False
+        self._lock = threading.Lock()
+        
+    def register(self, detector: 'MouseDetector') -> bool:
+        """
+        Registra um detector para ser notificado de mudancas
+        
+        Returns:
+            bool: True se ha um monitor de eventos ativo nesta plataforma
+        """
+        with self._lock:
+            self.detectors.add(detector)
+            if not self._started:
+                self._started = True
+                try:
+                    self.active = self._start()
+                except Exception as e:
+                    print(f"Monitor de dispositivos indisponivel: {e}")
+                    self.active = False
+        return self.active
+    
+    def _notify(self):
+        """Marca o cache de todos os detectores como desatualizado"""
+        for detector in list(self.detectors):
+            detector._dirty = True
+            
+    def _start(self) -> bool:
+        """Inicia o monitor adequado a plataforma"""
+        if sys.platform == "win32":
+            return system_events.subscribe(system_events.WM_DEVICECHANGE, self._on_device_change)
+        
+        #Linux: udev via pyudev (opcional)
+        try:
+            import pyudev
+        except ImportError:
+            return False
+        
+        monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        monitor.filter_by('hidraw')
+        observer = pyudev.MonitorObserver(monitor, callback=lambda device: self._notify())
+        observer.daemon = True
+        observer.start()
+        return True
+    
+    def _on_device_change(self, wparam: int, lparam: int):
+        """Callback de WM_DEVICECHANGE vindo da janela de eventos do sistema"""
+        if wparam in (self.DBT_DEVNODES_CHANGED, self.DBT_DEVICEARRIVAL,
+                      self.DBT_DEVICEREMOVECOMPLETE):
+            self._notify()
+            
+
+_device_monitor = _DeviceChangeMonitor()
+
+    
 class MouseDetector:
     """
     Detector de mouses conectados via HID
@@ -41,6 +141,17 @@ class MouseDetector:
         'gaming', 'trackball', 'touchpad', 'pointer'
     ]
     
+    #regex pre-compiladas: uma unica busca em C por string em vez de um loop por palavra
+    _MOUSE_RE = re.compile("|".join(map(re.escape, MOUSE_KEYWORDS)), re.IGNORECASE)
+    _EXCLUDE_RE = re.compile(r"keyboard|headset|webcam", re.IGNORECASE)
+    
+    #todos os indicadores de conexao em uma unica passada sobre os bytes do path
+    _CONNECTION_RE = re.compile(
+        rb'(?P<usb>usb)|(?P<bt>bluetooth|bthle|bth)|(?P<i2c>i2c)|(?P<hid>hid)'
+        rb'|(?P<ps2>ps2|ps/2)|(?P<vid>vid_)|(?P<pid>pid)',
+        re.IGNORECASE
+    )
+    
     # VIDs conhecidos de fabricantes de mouses
     KNOWN_MOUSE_VENDORS = {
         0x046D: 'Logitech',
@@ -60,12 +171,20 @@ class MouseDetector:
         0x17EF: 'Lenovo',
         0x045E: 'Microsoft'
     }
+    _KNOWN_VIDS = frozenset(KNOWN_MOUSE_VENDORS)
     
     def __init__(self):
         """Inicializa o detector de mouses"""
         self.mice_info: List[MouseInfo] = []
+        self._by_connection: Dict[str, List[MouseInfo]] = {}
+        self._summary: Dict[str, int] = self._make_summary(0, {})
         self.last_scan_time: float = 0
-        self.scan_cache_duration: float = 2.0 #cache por 2 secs
+        self.scan_cache_duration: float = 2.0 #cache por 2 secs (sem monitor de eventos)
+        self.monitored_cache_duration: float = 60.0 #teto do cache quando ha monitor de eventos
+        
+        #marcado pelo monitor de dispositivos quando algo e conectado/desconectado
+        self._dirty = True
+        self._monitor_active = _device_monitor.register(self)
         
     def get_connected_mice(self, force_refresh: bool = False) -> List[MouseInfo]:
         """
@@ -79,28 +198,57 @@ class MouseDetector:
         """
         current_time = time.time()
         
+        #com monitor de eventos o cache so expira quando o SO avisa de mudanca
+        #(ou no teto de seguranca); sem monitor vale o TTL curto
+        if self._monitor_active:
+            cache_duration = self.monitored_cache_duration
+        else:
+            cache_duration = self.scan_cache_duration
+            
         # Usa cache se n forcar refresh e estuver dentro do tempo
-        if not force_refresh and (current_time - self.last_scan_time) < self.scan_cache_duration:
+        if (not force_refresh and not self._dirty
+                and (current_time - self.last_scan_time) < cache_duration):
             return self.mice_info
         
-        self.mice_info = []
+        #limpa antes de enumerar para que eventos durante a varredura nao se percam
+        self._dirty = False
         
         try:
             #enumera todos os dispositivos HID
             devices = hid.enumerate()
             
+            #metodos resolvidos uma vez fora do loop
+            is_mouse = self._is_mouse_device
+            extract = self._extract_mouse_info
+            #a lista nova e montada a parte e publicada com uma unica atribuicao:
+            #a interface le mice_info de outra thread e nunca ve uma lista pela metade
+            found = []
+            append = found.append
+            
             for device in devices:
+                #campos usados por varios criterios sao lidos uma unica vez
+                vendor_id = device.get('vendor_id', 0)
+                product_string = device.get('product_string') or ''
+                
                 #filtra apenas dispositivos que sao mouses
-                if self._is_mouse_is_device(device):
-                    mouse_info = self._extract_mouse_info(device)
+                if is_mouse(device, vendor_id, product_string):
+                    mouse_info = extract(device, vendor_id, product_string)
                     if mouse_info:
-                        self.mice_info.append(mouse_info)
+                        append(mouse_info)
             
             #remove duplicatas baseado no path
-            self.mice_info = self._remove_duplicates(self.mice_info)
+            found = self._remove_duplicates(found)
             
             #ordena por nome para consistencia
-            self.mice_info.sort(key=lambda x: x.name.lower())
+            found.sort(key=operator.attrgetter('name_lc'))
+            
+            #indice por tipo de conexao, montado uma vez por varredura
+            by_connection = defaultdict(list)
+            for mouse in found:
+                by_connection[mouse.connection_type.lower()].append(mouse)
+            self._by_connection = by_connection
+            self._summary = self._make_summary(len(found), by_connection)
+            self.mice_info = found
             
             self.last_scan_time = current_time
             
@@ -108,15 +256,20 @@ class MouseDetector:
             print(f"Erro ao detectar mouses: {e}")
             # Em caso de erro, retorna lista vazia mas nao quebra
             self.mice_info = []
+            self._by_connection = {}
+            self._summary = self._make_summary(0, {})
+            self._dirty = True
             
         return self.mice_info
 
-    def _is_mouse_is_device(self, device: Dict) -> bool:
+    def _is_mouse_device(self, device: Dict, vendor_id: int, product_string: str) -> bool:
         """
         Verific se o dispositivo e um mouse usando multiplos criterios
         
         Args:
             device (Dict): Informacoes do dispositivo HID
+            vendor_id (int): VID ja lido do dispositivo
+            product_string (str): nome do produto ja lido do dispositivo
             
         Returns:
             bools: True se for um mouse
@@ -129,16 +282,13 @@ class MouseDetector:
             return True
         
         #criterio 2: verifica pelo nome do produto
-        product_string = device.get('product_string', '').lower
-        if any(keyword in product_string for keyword in self.MOUSE_KEYWORDS):
+        if self._MOUSE_RE.search(product_string):
             return True
         
         #criterio 3: verifica VID de fabricantes conhecidos de mouses
-        vendor_id = device.get('vendor_id', 0)
-        if vendor_id in self.KNOWN_MOUSE_VENDORS:
-            #para VIDs conhecidos, verifica se nao e teclado ou outro dispositovo
-            if not any(exclude in product_string for exclude in ['keyboard', 'headset', 'webcam']):
-                return True
+        #para VIDs conhecidos, verifica se nao e teclado ou outro dispositovo
+        if vendor_id in self._KNOWN_VIDS and not self._EXCLUDE_RE.search(product_string):
+            return True
         
         #criterio 4: interface especifica de mouse (interface 0 geralmente e um mouse)
         interface_number = device.get('interface_number', -1)
@@ -147,28 +297,33 @@ class MouseDetector:
         
         return False
     
-    def _extract_mouse_info(self, device: Dict) -> Optional[MouseInfo]:
+    def _extract_mouse_info(self, device: Dict, vendor_id: int, product_string: str) -> Optional[MouseInfo]:
         """
         Extrai informacoes relevantes do mouse
         
         Args:
             device (Dict): informacoes do dispositivo HID
+            vendor_id (int): VID ja lido do dispositivo
+            product_string (str): nome do produto ja lido do dispositivo
             
         Returns:
             Optional[MouseInfo]: informacoe formatadas do mouse
         """
         try:
-            vendor_id = device.get('vendor_id', 0)
             product_id = device.get('product_id', 0)
             
             #nome do produto com fallback inteligente
-            name = self._get_device_name(device, vendor_id, product_id)
+            name = self._get_device_name(product_string, vendor_id, product_id)
             
             #fabricante com fallback para VIDs conhecidos
             manufacturer = self._get_manufacturer_name(device, vendor_id)
             
+            #paths HID sao ASCII: um unico decode barato, os bytes vao direto pro regex
+            path_bytes = device.get('path', b'')
+            path_str = path_bytes.decode('ascii', 'replace')
+            
             #determina o tipo de conexao
-            connection_type = self._get_connection_type(device.get('path', b''))
+            connection_type = self._get_connection_type(path_bytes)
             
             #numero serial com tratamento especial
             serial_number = self._get_serial_number(device)
@@ -179,11 +334,11 @@ class MouseDetector:
             mouse_info = MouseInfo(
                 name=name,
                 manufacturer=manufacturer,
-                vendor_id=f"0x{vendor_id:04X}",
-                product_id=f"0x{product_id:04X}",
+                vendor_id=self._fmt_id(vendor_id),
+                product_id=self._fmt_id(product_id),
                 connection_type=connection_type,
                 serial_number=serial_number,
-                path=device.get('path', b'').decode('utf-8', errors='ignore'),
+                path=path_str,
                 interface_number=device.get('interface_number', -1),
                 release_number=release_number,
                 usage_page=device.get('usage_page', 0),
@@ -196,16 +351,28 @@ class MouseDetector:
             print(f"Erro ao extrair informacoes do mouse: {e}")
             return None
         
-    def _get_device_name(self, device: Dict, vendor_id: int, product_id: int) -> str:
+    def _get_device_name(self, product_string: str, vendor_id: int, product_id: int) -> str:
         """Obtem o nome do dispositivo com fallback inteligentes"""
-        name = device.get('product_string', '').strip()
+        name = product_string.strip()
         
         if name:
             return name
         
+        return self._fallback_device_name(vendor_id, product_id)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _fmt_id(number: int) -> str:
+        """Formata um VID/PID como 0xXXXX (string internada, a mesma em toda varredura)"""
+        return sys.intern(f"0x{number:04X}")
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _fallback_device_name(vendor_id: int, product_id: int) -> str:
+        """Nome para dispositivos sem product_string (memoizado por VID/PID)"""
         #fallback para VIDs conhecidos
-        if vendor_id in self.KNOWN_MOUSE_VENDORS:
-            manufacturer = self.KNOWN_MOUSE_VENDORS[vendor_id]
+        if vendor_id in MouseDetector._KNOWN_VIDS:
+            manufacturer = MouseDetector.KNOWN_MOUSE_VENDORS[vendor_id]
             return f"{manufacturer} Mouse (PID: 0x{product_id:04X})"
         
         #fallback generico
@@ -213,7 +380,7 @@ class MouseDetector:
     
     def _get_manufacturer_name(self, device: Dict, vendor_id: int) -> str:
         """Obtem o nome do fabricante com fallback para VIDs conhecidos"""
-        manufacturer = device.get('manufacturer_string', '').strip()
+        manufacturer = (device.get('manufacturer_string') or '').strip()
         
         if manufacturer:
             return manufacturer
@@ -222,7 +389,7 @@ class MouseDetector:
         if vendor_id in self.KNOWN_MOUSE_VENDORS:
             return self.KNOWN_MOUSE_VENDORS[vendor_id]
         
-        return f"Fabricante Desconhecido (VID: 0x{vendor_id:04X})"
+        return f"Fabricante Desconhecido (VID: {self._fmt_id(vendor_id)})"
     
     def _get_connection_type(self, path: bytes) -> str:
         """
@@ -235,22 +402,23 @@ class MouseDetector:
         str: tipo de conexao detalhado
         """
         try:
-            path_str = path.decode('utf-8', errors='ignore').lower()
+            #os indicadores sao ASCII, entao a busca roda direto nos bytes sem decode
+            found = {match.lastgroup for match in self._CONNECTION_RE.finditer(path)}
             
             #analise mais detalhada do path
-            if 'usb' in path_str:
-                if 'vid_' in path_str and 'pid' in path_str:
+            if 'usb' in found:
+                if 'vid' in found and 'pid' in found:
                     return 'USB'
                 else:
                     return 'USB (Generico)'
-            elif any(bt_indicator in path_str for bt_indicator in ['bluetooth', 'bth', 'bthle']):
+            elif 'bt' in found:
                 return 'Bluetooth'
-            elif 'hid' in path_str:
-                if 'i2c' in path_str:
+            elif 'hid' in found:
+                if 'i2c' in found:
                     return 'I2C HID'
                 else:
                     return 'HID'
-            elif 'ps2' in path_str or 'ps/2' in path_str:
+            elif 'ps2' in found:
                 return 'PS/2'
             else:
                 return 'Desconhecido'
@@ -287,15 +455,8 @@ class MouseDetector:
     
     def _remove_duplicates(self, mice_list: List[MouseInfo]) -> List[MouseInfo]:
         """Remove mouses duplicados baseado no path"""
-        seen_paths = set()
-        unique_mice = []
-        
-        for mouse in mice_list:
-            if mouse.path not in seen_paths:
-                seen_paths.add(mouse.path)
-                unique_mice.append(mouse)
-                
-            return unique_mice
+        #dict preserva a ordem de insercao e faz o dedup todo em C
+        return list({mouse.path: mouse for mouse in mice_list}.values())
         
     def get_mouse_count(self) -> int:
         """
@@ -325,8 +486,7 @@ class MouseDetector:
         Returns:
             List[MouseInfo]: Mouses do tipo especifico
         """
-        return [mouse for mouse in self.mice_info
-                if mouse.connection_type.lower() == connection_type.lower()]
+        return list(self._by_connection.get(connection_type.lower(), ()))
     
     def get_mice_by_manufacturer(self, manufacturer: str) -> List[MouseInfo]:
         """
@@ -347,13 +507,17 @@ class MouseDetector:
         Returns:
             Dict[str, int]: Resumo com contadores por tipo
         """
-        summary = {
-            'total': len(self.mice_info),
-            'usb': len(self.get_mice_by_connection_type('USB')),
-            'blutetooth': len(self.get_mice_by_connection_type('Bluetooth')),
-            'outros': 0
-        }
-        
-        summary['outros'] = summary['total'] - summary['usb'] - summary['bluetooth']
-        
-        return summary
\ No newline at end of file
+        #calculado uma vez por varredura junto com o indice por conexao
+        return dict(self._summary)
+    
+    @staticmethod
+    def _make_summary(total: int, by_connection: Dict[str, List[MouseInfo]]) -> Dict[str, int]:
+        """Contadores por tipo de conexao a partir do indice da varredura"""
+        usb = len(by_connection.get('usb', ()))
+        bluetooth = len(by_connection.get('bluetooth', ()))
+        return {
+            'total': total,
+            'usb': usb,
+            'bluetooth': bluetooth,
+            'outros': total - usb - bluetooth
+        }
\ No newline at end of file
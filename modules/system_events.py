@@ -0,0 +1,158 @@
+"""
+Modulo para receber mensagens de sistema do Windows (dispositivos e configuracoes)
+Utiliza uma janela oculta com loop de mensagens em uma thread propria
+Versao: 1.0.0
+"""
+
+import sys
+import threading
+import weakref
+from typing import Callable, Dict, List
+
+__all__ = ['WM_SETTINGCHANGE', 'WM_DEVICECHANGE', 'subscribe']
+
+#Mensagens do Windows
+WM_SETTINGCHANGE = 0x001A
+WM_DEVICECHANGE = 0x0219
+
+
+class SystemEventListener:
+    """
+    Janela oculta unica por processo que repassa mensagens para callbacks
+    WM_DEVICECHANGE e WM_SETTINGCHANGE so sao enviados para janelas top-level,
+    por isso a janela nao usa HWND_MESSAGE
+    """
+
+    def __init__(self):
+        self._callbacks: Dict[int, List[Callable]] = {}
+        self.active = False
+        self._started = False
+        self._lock = threading.Lock()
+
+    def subscribe(self, message: int, callback: Callable[[int, int], None]) -> bool:
+        """
+        Registra um callback(wparam, lparam) para uma mensagem do Windows
+        Metodos ligados sao guardados por referencia fraca
+
+        Returns:
+            bool: True se a janela de eventos esta ativa
+        """
+        if sys.platform != "win32":
+            return False
+
+        if hasattr(callback, '__self__'):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+
+        with self._lock:
+            self._callbacks.setdefault(message, []).append(ref)
+            if not self._started:
+                self._started = True
+                ready = threading.Event()
+                thread = threading.Thread(target=self._run_message_loop, args=(ready,),
+                                          name="SystemEventListener", daemon=True)
+                thread.start()
+                ready.wait(2.0)
+        return self.active
+
+    def _dispatch(self, message: int, wparam: int, lparam: int):
+        """Chama os callbacks registrados, descartando os que ja morreram"""
+        refs = self._callbacks.get(message)
+        if not refs:
+            return
+
+        for ref in list(refs):
+            callback = ref()
+            if callback is None:
+                refs.remove(ref)
+                continue
+            try:
+                callback(wparam, lparam)
+            except Exception as e:
+                print(f"Erro no callback de evento do sistema: {e}")
+
+    def _run_message_loop(self, ready: threading.Event):
+        """Cria a janela oculta e bombeia mensagens ate o fim do processo"""
+        import ctypes
+        from ctypes import wintypes
+
+        try:
+            user32 = ctypes.WinDLL("user32", use_last_error=True)
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+            LRESULT = ctypes.c_ssize_t
+            WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT,
+                                         wintypes.WPARAM, wintypes.LPARAM)
+
+            class WNDCLASSW(ctypes.Structure):
+                _fields_ = [
+                    ('style', wintypes.UINT),
+                    ('lpfnWndProc', WNDPROC),
+                    ('cbClsExtra', ctypes.c_int),
+                    ('cbWndExtra', ctypes.c_int),
+                    ('hInstance', wintypes.HINSTANCE),
+                    ('hIcon', wintypes.HICON),
+                    ('hCursor', wintypes.HANDLE),
+                    ('hbrBackground', wintypes.HBRUSH),
+                    ('lpszMenuName', wintypes.LPCWSTR),
+                    ('lpszClassName', wintypes.LPCWSTR),
+                ]
+
+            user32.DefWindowProcW.argtypes = (wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+            user32.DefWindowProcW.restype = LRESULT
+            user32.CreateWindowExW.argtypes = (wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR,
+                                               wintypes.DWORD, ctypes.c_int, ctypes.c_int,
+                                               ctypes.c_int, ctypes.c_int, wintypes.HWND,
+                                               wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID)
+            user32.CreateWindowExW.restype = wintypes.HWND
+            user32.GetMessageW.argtypes = (ctypes.POINTER(wintypes.MSG), wintypes.HWND,
+                                           wintypes.UINT, wintypes.UINT)
+            kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+
+            def wnd_proc(hwnd, msg, wparam, lparam):
+                if msg in self._callbacks:
+                    self._dispatch(msg, wparam, lparam)
+                return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+            #a referencia ao callback precisa viver enquanto a janela existir
+            proc = WNDPROC(wnd_proc)
+            hinstance = kernel32.GetModuleHandleW(None)
+
+            window_class = WNDCLASSW()
+            window_class.lpfnWndProc = proc
+            window_class.hInstance = hinstance
+            window_class.lpszClassName = "MouseManagerSystemEvents"
+
+            if not user32.RegisterClassW(ctypes.byref(window_class)):
+                return
+
+            hwnd = user32.CreateWindowExW(0, window_class.lpszClassName, "", 0,
+                                          0, 0, 0, 0, None, None, hinstance, None)
+            if not hwnd:
+                return
+
+            self.active = True
+        except Exception as e:
+            print(f"Erro ao criar janela de eventos do sistema: {e}")
+            return
+        finally:
+            ready.set()
+
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+
+_listener = SystemEventListener()
+
+
+def subscribe(message: int, callback: Callable[[int, int], None]) -> bool:
+    """
+    Registra um callback(wparam, lparam) na janela de eventos do processo
+
+    Returns:
+        bool: True se os eventos serao entregues (apenas Windows)
+    """
+    return _listener.subscribe(message, callback)
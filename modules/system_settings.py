@@ -5,13 +5,114 @@
 """
     
 import ctypes
-from ctypes import wintypes, byref, c_int, c_uint, c_bool, Structure, POINTER
-import winreg
+from ctypes import wintypes, byref, c_int, c_uint, Structure, POINTER
+import os
+import pickle
 import sys
-from typing import Tuple, Optional, Dict, Any
+import threading
+from typing import Tuple, Optional, Dict, Any, List
 from dataclasses import dataclass
 from enum import IntEnum
 
+from . import system_events
+
+#extensao Cython opcional (modules/_system_settings.pyx); sem ela tudo passa pelo ctypes
+try:
+    from . import _system_settings as _native
+except ImportError:
+    _native = None
+
+#Constantes do Windows para SystemParametersInfo
+SPI_GETMOUSESPEED = 0x0070
+SPI_SETMOUSESPEED = 0x0071
+SPI_GETMOUSE = 0x0003
+SPI_SETMOUSE = 0x0004
+SPI_GETMOUSEBUTTONSWAP = 0x0016
+SPI_SETMOUSEBUTTONSWAP = 0x0021
+SPI_GETWHEELSCROLLLINES = 0x0068
+SPI_SETWHEELSCROLLLINES = 0x0069
+SPI_GETMOUSEHOVERTIME = 0x0066
+SPI_SETMOUSEHOVERTIME = 0x0067
+SPI_GETDRAGFULLWINDOWS = 0x0026
+SPI_SETDRAGFULLWINDOWS = 0x0025
+
+#Flags para SystemParametersInfo
+SPIF_UPDATEFILE = 0x01
+SPIF_SENDCHANGE = 0x02
+SPIF_SENDWININICHANGE = 0x02
+
+#Constantes para o broadcast de WM_SETTINGCHANGE
+HWND_BROADCAST = 0xFFFF
+WM_SETTINGCHANGE = system_events.WM_SETTINGCHANGE
+SMTO_ABORTIFHUNG = 0x0002
+
+#Constantes para GetSystemMetrics
+SM_CXDRAG = 68
+SM_CYDRAG = 69
+SM_SWAPBUTTON = 23
+
+def _prototype(function, argtypes, restype):
+    """Define argtypes/restype de uma funcao Win32 e a devolve"""
+    function.argtypes = argtypes
+    function.restype = restype
+    return function
+
+#DLLs e prototipos carregados uma unica vez por processo (handles privados:
+#nao altera os prototipos do ctypes.windll compartilhado)
+if sys.platform == "win32":
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _shell32 = ctypes.WinDLL("shell32", use_last_error=True)
+    
+    _SPI = _prototype(_user32.SystemParametersInfoW,
+                      (wintypes.UINT, wintypes.UINT, wintypes.LPVOID, wintypes.UINT),
+                      wintypes.BOOL)
+    _GetDoubleClickTime = _prototype(_user32.GetDoubleClickTime, (), wintypes.UINT)
+    _SetDoubleClickTime = _prototype(_user32.SetDoubleClickTime, (wintypes.UINT,), wintypes.BOOL)
+    _GetSystemMetrics = _prototype(_user32.GetSystemMetrics, (c_int,), c_int)
+    _IsProcessDPIAware = _prototype(_user32.IsProcessDPIAware, (), wintypes.BOOL)
+    _SendMessageTimeoutW = _prototype(_user32.SendMessageTimeoutW,
+                                      (wintypes.HWND, wintypes.UINT, wintypes.WPARAM,
+                                       wintypes.LPARAM, wintypes.UINT, wintypes.UINT,
+                                       POINTER(ctypes.c_size_t)),
+                                      ctypes.c_ssize_t)
+    _IsUserAnAdmin = _prototype(_shell32.IsUserAnAdmin, (), wintypes.BOOL)
+    
+    #elevacao e DPI awareness sao fixos durante a vida do processo:
+    #uma mudanca so e vista depois de reiniciar a aplicacao (como no proprio Windows)
+    _IS_ADMIN = bool(_IsUserAnAdmin())
+    _DPI_AWARE = bool(_IsProcessDPIAware())
+
+#leituras SPI_GET* de get_current_settings: (variavel, acao, expressao do valor lido)
+_SPI_READS = (
+    ('speed', SPI_GETMOUSESPEED, 'speed_buf.value'),
+    ('accel', SPI_GETMOUSE, 'tuple(accel_buf)'),
+    ('swap', SPI_GETMOUSEBUTTONSWAP, 'bool(swap_buf.value)'),
+    ('lines', SPI_GETWHEELSCROLLLINES, 'lines_buf.value'),
+    ('hover', SPI_GETMOUSEHOVERTIME, 'hover_buf.value'),
+)
+
+def _build_read_all_factory():
+    """
+    Gera (uma vez, no import) a fabrica da funcao que le todas as configuracoes
+    As chamadas ficam inline em um unico frame, com funcoes e buffers no closure;
+    o resultado tem o mesmo formato de SystemMouseSettingsC.read_all
+    """
+    buffers = ', '.join(f'{name}_buf' for name, _, _ in _SPI_READS)
+    src = [f'def make_read_all(spi, gdc, gsm, byref, lock, {buffers}):',
+           '    def read_all():',
+           '        with lock:']
+    for name, action, value in _SPI_READS:
+        src.append(f'            {name} = {value} if spi({action}, 0, byref({name}_buf), 0) else None')
+    src += [f'        return (speed, accel, gdc(), swap, lines, hover, (gsm({SM_CXDRAG}), gsm({SM_CYDRAG})))',
+            '    return read_all']
+    
+    namespace = {}
+    exec('\n'.join(src), {'tuple': tuple, 'bool': bool}, namespace)
+    return namespace['make_read_all']
+
+_make_read_all = _build_read_all_factory()
+
 class MouseAcceleration(IntEnum):
     """Niveis de aceleracao do mouse"""
     DISABLE = 0
@@ -19,9 +120,12 @@ class MouseAcceleration(IntEnum):
     MEDIUM = 2
     HIGH = 3
     
-@dataclass
+#slots=True so existe a partir do Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+    
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class MouseSettings:
-    """Classe de dados para configuracoes do mouse"""
+    """Classe de dados (imutavel) para configuracoes do mouse"""
     speed: int                     
     acceleration_enable: bool      
     acceleration_threshold1: int   
@@ -40,43 +144,68 @@ class SystemMouseSettings:
     Utilizar APIs nativas do Windows para maxima compatibilidade
     """    
     
-    #Constantes do Windows para SystemParametersInfo
-    SPI_GETMOUSESPEED = 0x0070
-    SPI_SETMOUSESPEED = 0x0071
-    SPI_GETMOUSE = 0x0003
-    SPI_SETMOUSE = 0x0004
-    SPI_GETMOUSEBUTTONSWAP = 0x0016
-    SPI_SETMOUSEBUTTONSWAP = 0x0021
-    SPI_GETWHEELSCROLLLINES = 0x0068
-    SPI_SETWHEELSCROLLLINES = 0x0069
-    SPI_GETMOUSEHOVERTIME = 0x0066
-    SPI_SETMOUSEHOVERTIME = 0x0067
-    SPI_GETDRAGFULLWINDOWS = 0x0026
-    SPI_SETDRAGFULLWINDOWS = 0x0025
+    #Chaves do resultado de apply_settings
+    APPLY_KEYS = ('speed', 'acceleration', 'double_click', 'button_swap', 'wheel_scroll', 'hover_time')
+    
+    #(limiar1, limiar2, fator) de SPI_SETMOUSE para cada nivel de aceleracao
+    ACCELERATION_LEVELS = {
+        MouseAcceleration.LOW: (4, 8, 1),
+        MouseAcceleration.MEDIUM: (6, 10, 1),
+        MouseAcceleration.HIGH: (8, 12, 2),
+    }
     
-    #Flags para SystemParametersInfo
-    SPIF_UPDATEFILE = 0x01
-    SPIF_SENDCHANGE = 0x02
-    SPIF_SENDWININICHANGE = 0x02
+    #timeout do broadcast de WM_SETTINGCHANGE
+    BROADCAST_TIMEOUT_MS = 100
     
-    #Constantes para GetSystemMetrics
-    SM_CXDRAG = 68
-    SM_CYDRAG = 69
-    SM_SWAPBUTTON = 23
+    #snapshots de backup mantidos em memoria; os mais antigos sao arquivados
+    MAX_ACTIVE_SNAPSHOTS = 10
+    MAX_ARCHIVED_SNAPSHOTS = 50
     
     def __init__ (self):
         """Inicializa o gerenciador de configuracoes do mouse"""
-        self.user32 = ctypes.windll.user32
-        self.kernel32 = ctypes.windll.kernel32
-        
         #verifica se esta no windows
         if sys.platform != "win32":
             raise OSError("Este modulo funciona apenas no Windows")
         
+        #apenas referencias: DLLs e prototipos ja foram carregados no import do modulo
+        self._user32 = _user32
+        self._kernel32 = _kernel32
+        self._shell32 = _shell32
+        self._SPI = _SPI
+        self._GetDoubleClickTime = _GetDoubleClickTime
+        self._SetDoubleClickTime = _SetDoubleClickTime
+        self._GetSystemMetrics = _GetSystemMetrics
+        self._IsProcessDPIAware = _IsProcessDPIAware
+        self._SendMessageTimeoutW = _SendMessageTimeoutW
+        self._IsUserAnAdmin = _IsUserAnAdmin
+        self._native = _native.SystemMouseSettingsC() if _native is not None else None
+        
+        #buffers ctypes reutilizados entre chamadas (sem alocacao por leitura)
+        #o lock protege os buffers, ja que as chamadas podem vir de threads da GUI
+        self._buf_lock = threading.Lock()
+        self._speed_buf = c_int()
+        self._accel_buf = (c_int * 3)()
+        self._swap_buf = wintypes.BOOL()
+        self._lines_buf = c_uint()
+        self._hover_buf = c_uint()
+        
+        #leitura de todas as configuracoes em uma chamada: extensao Cython ou funcao gerada
+        if self._native is not None:
+            self._read_all = self._native.read_all
+        else:
+            self._read_all = _make_read_all(self._SPI, self._GetDoubleClickTime,
+                                            self._GetSystemMetrics, byref, self._buf_lock,
+                                            self._speed_buf, self._accel_buf, self._swap_buf,
+                                            self._lines_buf, self._hover_buf)
+        
         #Cache das configuracoes atuais
         self._settings_cache: Optional[MouseSettings] = None
         self._cache_valid = False
         
+        #o cache so e invalidado quando o Windows avisa que algo mudou (WM_SETTINGCHANGE)
+        self._change_events = system_events.subscribe(system_events.WM_SETTINGCHANGE,
+                                                      self._on_system_setting_change)
+        
         #Configuracao padrao do Windows
         self.default_settings = MouseSettings(
             speed=10,
@@ -92,6 +221,43 @@ class SystemMouseSettings:
             drag_height=4,
         )
         
+        #snapshots ativos (indexados pelo proprio valor, em ordem de criacao) e arquivados
+        #os arquivados so vao para o disco em archive_snapshots()
+        self._snapshots: Dict[MouseSettings, MouseSettings] = {}
+        self._archived_snapshots: List[MouseSettings] = []
+        
+        #versao/metricas nao mudam durante o processo: calculadas uma vez
+        #so sao descartadas por _invalidate_cache(hard=True)
+        self._system_info: Optional[Dict[str, Any]] = None
+        self.get_system_info()
+        
+    def _set_raw(self, action: int, ui_param: int, pv_param, broadcast: bool = False) -> bool:
+        """
+        SystemParametersInfoW para as acoes SPI_SET*
+        Sempre grava no perfil; so envia WM_SETTINGCHANGE quando broadcast=True
+        """
+        flags = SPIF_UPDATEFILE
+        if broadcast:
+            flags |= SPIF_SENDCHANGE
+        return bool(self._SPI(action, ui_param, pv_param, flags))
+    
+    def _broadcast_setting_change(self) -> bool:
+        """Envia um unico WM_SETTINGCHANGE para todas as janelas de nivel superior"""
+        try:
+            result = ctypes.c_size_t()
+            return bool(self._SendMessageTimeoutW(
+                HWND_BROADCAST,
+                WM_SETTINGCHANGE,
+                0,
+                0,
+                SMTO_ABORTIFHUNG,
+                self.BROADCAST_TIMEOUT_MS,
+                byref(result)
+            ))
+        except Exception as e:
+            print(f"Erro ao notificar mudanca de configuracoes: {e}")
+            return False
+    
     def get_mouse_speed(self) -> int:
         """ 
         Obtem a velocidade atual do mouse (1-20)
@@ -100,17 +266,18 @@ class SystemMouseSettings:
             int: Velocidade do mouse (1-20)
         """
         try:
-            spped = c_int()
-            result = self.user32.SystemParametersInfoW(
-                self.SPI_GETMOUSESPEED,
-                0,
-                byref(spped),
-                0
-            )
+            with self._buf_lock:
+                result = self._SPI(
+                    SPI_GETMOUSESPEED,
+                    0,
+                    byref(self._speed_buf),
+                    0
+                )
+                speed = self._speed_buf.value
             
             if result:
                 #Garante que esta no range valido
-                return max(1, min(20, spped.value))
+                return max(1, min(20, speed))
             else:
                 return self.default_settings.speed
             
@@ -118,12 +285,13 @@ class SystemMouseSettings:
             print(f"Erro ao obter velocidade do mouse: {e}")
             return self.default_settings.speed
         
-    def set_mouse_speed(self, speed: int) -> bool:
+    def set_mouse_speed(self, speed: int, broadcast: bool = True) -> bool:
         """ 
         Define a velocidade do mouse (1-20)
         
         Args:
             speed(int): Nova velocidade(1-20)
+            broadcast (bool): envia WM_SETTINGCHANGE (apply_settings agrupa em um so)
             
         Returns:
             bool: True se bem-sucedido
@@ -132,12 +300,7 @@ class SystemMouseSettings:
             #valida e limita o valor
             speed = max(1, min(20, int(speed)))
             
-            result = self.user32.SystemParametersInfoW(
-                self.SPI_SETMOUSESPEED,
-                0,
-                speed,
-                self.SPIF_UPDATEINIFILE | self.SPIF_SENDCHANGE
-            )
+            result = self._set_raw(SPI_SETMOUSESPEED, 0, speed, broadcast)
             
             if result:
                 self._invalidate_cache()
@@ -157,16 +320,17 @@ class SystemMouseSettings:
             TUple[int, int, int]: (threshold1, threshold2, acceleration)
         """
         try:
-            mouse_params = (c_int * 3)()
-            result = self.user32.SystemParametersInfoW(
-                self.SPI_GETMOUSE,
-                0,
-                mouse_params,
-                0
-            )
+            with self._buf_lock:
+                result = self._SPI(
+                    SPI_GETMOUSE,
+                    0,
+                    byref(self._accel_buf),
+                    0
+                )
+                mouse_params = tuple(self._accel_buf)
             
             if result:
-                return tuple(mouse_params)
+                return mouse_params
             else:
                 return (
                     self.default_settings.acceleration_threshold1,
@@ -178,7 +342,8 @@ class SystemMouseSettings:
             print(f"Erro ao obter aceleracao do mouse: {e}")
             return(6,10,1)
         
-    def set_mouse_acceleration(self, threshold1: int, threshold2: int, acceleration: int) -> bool:
+    def set_mouse_acceleration(self, threshold1: int, threshold2: int, acceleration: int,
+                               broadcast: bool = True) -> bool:
         """ 
         Define as configuracoes de aceleracao do mouse
         
@@ -186,6 +351,7 @@ class SystemMouseSettings:
             threshold1(int): Primeiro limiar de aceleracao (0-20)
             threshold2(int): Segundo Limiar de aceleracao (0-20)
             acceleration(int): Fator de aceleracao (0-3)
+            broadcast (bool): envia WM_SETTINGCHANGE (apply_settings agrupa em um so)
             
         Returns:
             bool: True se bem-sucedido
@@ -196,13 +362,9 @@ class SystemMouseSettings:
             threshold2 = max(0, min(20, int(threshold2)))
             acceleration = max(0, min(3, int(acceleration)))
             
-            mouse_params = (c_int * 3)(threshold1, threshold2, acceleration)
-            result = self.user32.SystemParametersInfoW(
-                self.SPI_SETMOUSE,
-                0,
-                mouse_params,
-                self.SPIF_UPDATEINIFILE | self.SPIF_SENDCHANGE
-            )
+            with self._buf_lock:
+                self._accel_buf[:] = (threshold1, threshold2, acceleration)
+                result = self._set_raw(SPI_SETMOUSE, 0, byref(self._accel_buf), broadcast)
             
             if result:
                 self._invalidate_cache()
@@ -224,14 +386,8 @@ class SystemMouseSettings:
         Returns:
             bool: True se bem-sucedido
         """
-        acceleration_configs = {
-            MouseAcceleration.LOW: (4,8,1),
-            MouseAcceleration.MEDIUM: (6,10,1),
-            MouseAcceleration.HIGH: (8,12,2)
-        }
-        
-        threshold1, threshold2, factor = acceleration_configs.get(
-            level, acceleration_configs[MouseAcceleration.MEDIUM]
+        threshold1, threshold2, factor = self.ACCELERATION_LEVELS.get(
+            level, self.ACCELERATION_LEVELS[MouseAcceleration.MEDIUM]
         )
         
         return self.set_mouse_acceleration(threshold1, threshold2, factor)
@@ -252,7 +408,7 @@ class SystemMouseSettings:
         Returns:
             bool: True se habilitada
         """
-        threshol1, thresold2, acceleration = self.get_mouse_acceleration()
+        _, _, acceleration = self.get_mouse_acceleration()
         return acceleration > 0
     
     def get_double_click_speed(self) -> int:
@@ -263,7 +419,7 @@ class SystemMouseSettings:
             int: Velocidade do duplo clique em ms
         """
         try:
-            return self.user32.GetDoubleClickTime()
+            return self._GetDoubleClickTime()
         except Exception as e:
             print(f"Erro ao obter velocidade do duplo clique: {e}")
             return self.default_settings.double_click_speed
@@ -281,7 +437,7 @@ class SystemMouseSettings:
         try:
             #valida e limita o valor
             speed_ms = max(100, min(900, int(speed_ms)))
-            result = self.user32.SetDoubleClickTime(speed_ms)
+            result = self._SetDoubleClickTime(speed_ms)
             
             if result:
                 self._invalidate_cache()
@@ -301,16 +457,17 @@ class SystemMouseSettings:
             bool: True se os otoes estao trocados
         """
         try:
-            swap = c_bool()
-            result = self.user32.SystemParametersInfoW(
-                self.SPI_GETMOUSEBUTTONSWAP,
-                0,
-                byref(swap),
-                0
-            )
+            with self._buf_lock:
+                result = self._SPI(
+                    SPI_GETMOUSEBUTTONSWAP,
+                    0,
+                    byref(self._swap_buf),
+                    0
+                )
+                swap = bool(self._swap_buf.value)
             
             if result:
-                return swap.value
+                return swap
             else:
                 return self.default_settings.swap_buttons
             
@@ -318,23 +475,19 @@ class SystemMouseSettings:
             print(f"Erro ao obter troca de botoes: {e}")
             return False
         
-    def set_button_swap(self, swap: bool) -> bool:
+    def set_button_swap(self, swap: bool, broadcast: bool = True) -> bool:
         """ 
         Define se os botoes do mouse devem ser trocados
         
         Args:
             swap (bool): True para trocar os botoes
+            broadcast (bool): envia WM_SETTINGCHANGE (apply_settings agrupa em um so)
             
         Returns:
             bool: True se bem-sucedido
         """
         try:
-            result = self.user32.SystemParametersInfoW(
-                self.SPI_SETMOUSEBUTTONSWAP,
-                1 if swap else 0,
-                None,
-                self.SPIF_UPDATEINIFILE | self.SPIF_SENDCHANGE
-            )
+            result = self._set_raw(SPI_SETMOUSEBUTTONSWAP, 1 if swap else 0, None, broadcast)
             
             if result:
                 self._invalidate_cache()
@@ -354,16 +507,17 @@ class SystemMouseSettings:
             int: Numero de linhas por scroll
         """
         try:
-            lines = c_uint()
-            result = self.user32.SystemParametersInfoW(
-                self.SPI_GetWHEELSCROLLLINES,
-                0,
-                byref(lines),
-                0
-            )
+            with self._buf_lock:
+                result = self._SPI(
+                    SPI_GETWHEELSCROLLLINES,
+                    0,
+                    byref(self._lines_buf),
+                    0
+                )
+                lines = self._lines_buf.value
             
             if result:
-                return max(1, min(100, lines.value))
+                return max(1, min(100, lines))
             else:
                 return self.default_settings.wheel_scroll_lines
             
@@ -371,12 +525,13 @@ class SystemMouseSettings:
             print(f"Erro ao obter linhas de scroll: {e}")
             return 3
         
-    def set_wheel_scroll_lines(self, lines: int) -> bool:
+    def set_wheel_scroll_lines(self, lines: int, broadcast: bool = True) -> bool:
         """ 
         Define o numero de linhas por scroll da roda
         
         Args:
             lines (int): numero de linhas (1-100)
+            broadcast (bool): envia WM_SETTINGCHANGE (apply_settings agrupa em um so)
             
         Returns:
             bool: True se bem-sucedido
@@ -385,12 +540,7 @@ class SystemMouseSettings:
             #valida e limita o valor
             lines = max(1, min(100, int(lines)))
             
-            result = self.user32.SystemParametersInfoW(
-                self.SPI_SETWHEELSCROLLLINES,
-                lines,
-                None,
-                self.SPIF_UPDATEINIFILE | self.SPIF_SENDCHANGE
-            )
+            result = self._set_raw(SPI_SETWHEELSCROLLLINES, lines, None, broadcast)
             
             if result:
                 self._invalidate_cache()
@@ -410,16 +560,17 @@ class SystemMouseSettings:
             int: Tempo de hover em ms
         """
         try:
-            hover_time = c_uint()
-            result = self.user32.SystemParamantersInfoW(
-                self.SPI_GETMOUSEHOVERTIME,
-                0,
-                byref(hover_time),
-                0
-            )
+            with self._buf_lock:
+                result = self._SPI(
+                    SPI_GETMOUSEHOVERTIME,
+                    0,
+                    byref(self._hover_buf),
+                    0
+                )
+                hover_time = self._hover_buf.value
             
             if result:
-                return hover_time.value
+                return hover_time
             else:
                 return self.default_settings.hover_time
             
@@ -427,12 +578,13 @@ class SystemMouseSettings:
             print(f"Erro ao obter tempo de hover: {e}")
             return 400
     
-    def set_hover_time(self, time_ms: int) -> bool:
+    def set_hover_time(self, time_ms: int, broadcast: bool = True) -> bool:
         """ 
         Define o tempo de hover
         
         Args:
             time_ms(int): Tempo em milissegundos (100-2000)
+            broadcast (bool): envia WM_SETTINGCHANGE (apply_settings agrupa em um so)
             
         Returns:
             bool: True se bem-sucedido
@@ -441,12 +593,7 @@ class SystemMouseSettings:
             #valida e limita o valor
             time_ms = max(100, min(2000, int(time_ms)))
             
-            result = self.user32.SystemParametersInfoW(
-                self.SPI_SETMOUSEHOVERTIME,
-                time_ms,
-                None,
-                self.SPIF_UPDATEINIFILE | self.SPIF_SENDCHANGE
-            )
+            result = self._set_raw(SPI_SETMOUSEHOVERTIME, time_ms, None, broadcast)
             
             if result:
                 self._invalidate_cache()
@@ -466,51 +613,64 @@ class SystemMouseSettings:
             Tuple[int, int]: (largura, altura) em pixels
         """
         try:
-            width = self.user32.GetSystemMetrics(self.SM_CXDRAG)
-            height = self.user32.GetSystemMetrics(self.SM_CYDRAG)
-            return (width, height)
+            gsm = self._GetSystemMetrics
+            return (gsm(SM_CXDRAG), gsm(SM_CYDRAG))
         except Exception as e:
             print(f"Erro ao obter dimensoes de drag: {e}")
             return (4, 4)
         
-    def get_current_settings(self) -> MouseSettings:
+    def get_current_settings(self, refresh: bool = False) -> MouseSettings:
         """ 
         Obtem todas as configuracoes atuais do mouse
         
+        Args:
+            refresh (bool): ignora o cache e rele do Windows
+            
         Returns:
             MouseSettings: objeto com todas as configuracoes
         """
-        if self._cache_valid and self._settings_cache:
+        #o cache vale ate um setter local ou um WM_SETTINGCHANGE invalida-lo; sem o
+        #listener de eventos uma mudanca feita por outro programa passaria despercebida
+        if self._cache_valid and self._change_events and not refresh:
             return self._settings_cache
         
         try:
-            threshold1, threshold2, acceleration = self.get_mouse_acceleration()
-            drag_widht, drag_height = self.get_drag_dimensions()
-            
-            seetings = MouseSettings(
-                speed= self.get_mouse_speed(),
-                acceleration_enable = self.is_acceleration_enable(),
-                acceleration_threshold1=threshold1,
-                acceleration_threshold2=threshold2,
-                acceleration_factor=acceleration,
-                double_click_speed=self.get_double_click_speed(),
-                swap_buttons=self.get_button_swap(),
-                wheel_scroll_lines=self.get_whell_scroll_lines(),
-                hover_time=self.get_hover_time(),
-                drag_width=drag_widht,
-                drag_height=drag_height
-            )
+            settings = self._settings_from_raw(self._read_all())
             
             #atualiza o cache
-            self._settings_cache = seetings 
-            self._cache_valid = True 
+            self._settings_cache = settings
+            self._cache_valid = True
             
-            return seetings 
+            return settings
         
         except Exception as e:
             print(f"Erro ao obter configuracoes: {e}")
             return self.default_settings
         
+    def _settings_from_raw(self, raw: tuple) -> MouseSettings:
+        """Valida a tupla de _read_all (None = leitura falhou) e monta o MouseSettings"""
+        speed, accel, double_click, swap, lines, hover, drag = raw
+        defaults = self.default_settings
+        
+        if accel is None:
+            accel = (defaults.acceleration_threshold1, defaults.acceleration_threshold2,
+                     defaults.acceleration_factor)
+            
+        #acceleration_enable sai da mesma leitura de SPI_GETMOUSE (sem uma segunda chamada)
+        return MouseSettings(
+            speed=max(1, min(20, speed)) if speed is not None else defaults.speed,
+            acceleration_enable=accel[2] > 0,
+            acceleration_threshold1=accel[0],
+            acceleration_threshold2=accel[1],
+            acceleration_factor=accel[2],
+            double_click_speed=double_click,
+            swap_buttons=swap if swap is not None else defaults.swap_buttons,
+            wheel_scroll_lines=max(1, min(100, lines)) if lines is not None else defaults.wheel_scroll_lines,
+            hover_time=hover if hover is not None else defaults.hover_time,
+            drag_width=drag[0],
+            drag_height=drag[1]
+        )
+        
     def apply_settings(self, settings: MouseSettings) -> Dict[str, bool]:
         """ 
         Aplica um conjunto completo de configuracoes
@@ -521,29 +681,70 @@ class SystemMouseSettings:
         Returns:
             Dict[str, bool]: Resultado de cada configuracao aplicada
         """
-        results = {}
+        #sem WM_SETTINGCHANGE o cache pode estar desatualizado: rele antes de comparar
+        if not self._change_events:
+            self._invalidate_cache()
+        current = self.get_current_settings()
+        
+        #get_current_settings devolve default_settings quando a leitura falha:
+        #nesse caso nao da para comparar e tudo e gravado
+        if current is self.default_settings:
+            changed = dict.fromkeys(self.APPLY_KEYS, True)
+        #campos que ja estao com o valor pedido contam como aplicados
+        elif current == settings:
+            return dict.fromkeys(self.APPLY_KEYS, True)
+        else:
+            changed = self._changed_fields(current, settings)
+        
+        #as alteracoes nao aplicadas (inclusive por excecao) ficam marcadas como falhadas
+        results = {key: not changed[key] for key in self.APPLY_KEYS}
         
         try:
-            results['speed'] = self.set_mouse_speed(settings.speed)
-            results['acceleration'] = self.set_mouse_acceleration(
-                settings.acceleration_threshold1,
-                settings.acceleration_threshold2,
-                settings.acceleration_factor
-            )
-            results['double_click'] = self.set_double_click_speed(settings.double_click_speed)
-            results['button_swap'] = self.set_button_swap(settings.swap_button)
-            results['wheel_scroll'] = self.set_wheel_scrool_lines(settings.wheel_scroll_lines)
-            results['hover_time'] = self.set_hover_time(settings.hover_time)
+            #cada setter so grava; um unico WM_SETTINGCHANGE e enviado no final
+            if changed['speed']:
+                results['speed'] = self.set_mouse_speed(settings.speed, broadcast=False)
+            if changed['acceleration']:
+                results['acceleration'] = self.set_mouse_acceleration(
+                    settings.acceleration_threshold1,
+                    settings.acceleration_threshold2,
+                    settings.acceleration_factor,
+                    broadcast=False
+                )
+            if changed['double_click']:
+                results['double_click'] = self.set_double_click_speed(settings.double_click_speed)
+            if changed['button_swap']:
+                results['button_swap'] = self.set_button_swap(settings.swap_buttons, broadcast=False)
+            if changed['wheel_scroll']:
+                results['wheel_scroll'] = self.set_wheel_scroll_lines(settings.wheel_scroll_lines,
+                                                                      broadcast=False)
+            if changed['hover_time']:
+                results['hover_time'] = self.set_hover_time(settings.hover_time, broadcast=False)
             
         except Exception as e:
             print(f"Erro ao aplicar configuracoes: {e}")
-            #marca todas as configuracoes como falhadas
-            for key in results:
-                if key not in results:
-                    results[key] = False
+            
+        #so ha broadcast se algo foi de fato gravado
+        written = any(changed[key] and results[key] for key in self.APPLY_KEYS)
+        if written:
+            self._broadcast_setting_change()
         
         return results
     
+    @staticmethod
+    def _changed_fields(current: MouseSettings, settings: MouseSettings) -> Dict[str, bool]:
+        """Indica, por chave de apply_settings, o que difere entre as duas configuracoes"""
+        return {
+            'speed': current.speed != settings.speed,
+            'acceleration': (current.acceleration_threshold1, current.acceleration_threshold2,
+                             current.acceleration_factor) !=
+                            (settings.acceleration_threshold1, settings.acceleration_threshold2,
+                             settings.acceleration_factor),
+            'double_click': current.double_click_speed != settings.double_click_speed,
+            'button_swap': current.swap_buttons != settings.swap_buttons,
+            'wheel_scroll': current.wheel_scroll_lines != settings.wheel_scroll_lines,
+            'hover_time': current.hover_time != settings.hover_time,
+        }
+        
     def restore_defaults(self) -> Dict[str, bool]:
         """ 
         Restaura todas as cofniguracoes para os valores padrao
@@ -560,7 +761,28 @@ class SystemMouseSettings:
         Returns:
             MouseSettings: backup das configuracoes atuais
         """
-        return self.get_current_settings()
+        settings = self.get_current_settings()
+        
+        #reinsere no fim para o snapshot repetido contar como o mais recente
+        #(a chave e o proprio snapshot: frozen e hashable, sem colisao de hash)
+        self._snapshots.pop(settings, None)
+        self._snapshots[settings] = settings
+        
+        #snapshots excedentes saem da memoria ativa e ficam aguardando o arquivamento
+        while len(self._snapshots) > self.MAX_ACTIVE_SNAPSHOTS:
+            oldest = next(iter(self._snapshots))
+            self._archived_snapshots.append(self._snapshots.pop(oldest))
+        
+        return settings
+    
+    def get_snapshots(self) -> List[MouseSettings]:
+        """ 
+        Retorna os snapshots ativos, do mais antigo para o mais recente
+        
+        Returns:
+            List[MouseSettings]: snapshots criados por backup_settings
+        """
+        return list(self._snapshots.values())
     
     def restore_from_backup(self, backup: MouseSettings) -> Dict[str,bool]:
         """ 
@@ -570,10 +792,52 @@ class SystemMouseSettings:
             backup (MouseSettings): Backup das configuracoes
             
         Returns:
-            Dict[str,bool]: resultado da restauracao
+            Dict[str,bool]: resultado da restauracao ({} se o backup ja e a configuracao atual)
         """
+        if backup == self.get_current_settings():
+            return {}
+        
         return self.apply_settings(backup)
     
+    def archive_snapshots(self, path: Optional[str] = None) -> bool:
+        """ 
+        Grava os snapshots (arquivados e ativos) em um unico arquivo pickle
+        Chamado ao encerrar a aplicacao
+        
+        Args:
+            path (str): arquivo de destino; por padrao %LOCALAPPDATA%\\mouse_manager\\snapshots.pkl
+            
+        Returns:
+            bool: True se o arquivo foi gravado
+        """
+        snapshots = self._archived_snapshots + list(self._snapshots.values())
+        if not snapshots:
+            return False
+        
+        if path is None:
+            base_dir = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+            path = os.path.join(base_dir, 'mouse_manager', 'snapshots.pkl')
+            
+        try:
+            #remove duplicados mantendo a ocorrencia mais recente
+            unique = list(dict.fromkeys(reversed(snapshots)))[::-1]
+            unique = unique[-self.MAX_ARCHIVED_SNAPSHOTS:]
+            
+            #escrita atomica (arquivo temporario + os.replace): um encerramento no
+            #meio da gravacao nao deixa um pickle truncado
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(unique, f)
+            os.replace(tmp_path, path)
+            
+            self._archived_snapshots.clear()
+            return True
+        
+        except Exception as e:
+            print(f"Erro ao arquivar snapshots: {e}")
+            return False
+    
     def get_settings_summary(self) -> Dict[str, Any]:
         """ 
         retorna um resumo das configuracoes atuais
@@ -585,7 +849,7 @@ class SystemMouseSettings:
         
         return {
             'velocidade': f"{settings.speed}/20",
-            'aceleracao': "Habilitada" if settings.acceleration_enable else "Desabailitada",
+            'aceleracao': "Habilitada" if settings.acceleration_enable else "Desabilitada",
             'duplo_clique': f"{settings.double_click_speed}ms",
             'botoes_trocados': "sim" if settings.swap_buttons else "Nao",
             'linhas_scroll': f"{settings.wheel_scroll_lines}linhas",
@@ -593,23 +857,34 @@ class SystemMouseSettings:
             'area_drag': f"{settings.drag_width}x{settings.drag_height}px"
         }
         
-    def _invalidate_cache(self):
-        """Invalida o cache de configuracoes"""
+    def _invalidate_cache(self, hard: bool = False):
+        """
+        Invalida o cache de configuracoes
+        
+        Args:
+            hard (bool): tambem descarta as informacoes do sistema
+        """
         self._cache_valid = False
         self._settings_cache = None
+        if hard:
+            self.invalidate_system_info()
+        
+    def invalidate_system_info(self):
+        """Descarta as informacoes do sistema; a proxima get_system_info rele do Windows"""
+        self._system_info = None
+        
+    def _on_system_setting_change(self, wparam: int, lparam: int):
+        """Callback de WM_SETTINGCHANGE: outra aplicacao (ou o painel) alterou algo"""
+        self._invalidate_cache()
         
     def is_admin_required(self) -> bool:
         """ 
         Verifica se privilegios administrativos sao necessarios
         
         Returns:
-            bool: True se admin e necessario
+            bool: True se admin e necessario (lido uma vez no import do modulo)
         """
-        try:
-            #tenta um operacao que pode requerer admin
-            return not bool(ctypes.windll.shell32.IsUserAnAdmin())
-        except:
-            return True 
+        return not _IS_ADMIN
         
     def get_system_info(self) -> Dict[str, Any]:
         """ 
@@ -618,14 +893,18 @@ class SystemMouseSettings:
         Returns:
             Dict[str, Any]: informacoes do sistema
         """
-        try:
-            return{
-                'windows_version': sys.getwindowsversion(),
-                'admin_required': self.is_admin_required(),
-                'swap_button_support': bool(self.user32.GetSystemMetrics(self.SM_SWAPBUTTON)),
-                'double_click_area': self.get_drag_dimensions(),
-                'system_dpi_aware': bool(self.user32.IsProcessDPIAware())
-            }
-        except Exception as e:
-            print(f"Erro ao obter informacoe do sistema: {e}")
-            return {}
\ No newline at end of file
+        if self._system_info is None:
+            try:
+                self._system_info = {
+                    'windows_version': sys.getwindowsversion(),
+                    'admin_required': self.is_admin_required(),
+                    'swap_button_support': bool(self._GetSystemMetrics(SM_SWAPBUTTON)),
+                    'double_click_area': self.get_drag_dimensions(),
+                    'system_dpi_aware': _DPI_AWARE
+                }
+            except Exception as e:
+                print(f"Erro ao obter informacoe do sistema: {e}")
+                return {}
+        
+        #copia rasa: quem chama pode alterar o dict sem afetar o cache
+        return dict(self._system_info)
@@ -5,33 +5,129 @@ Versao: 1.0.0
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext, font 
+from tkinter import ttk, messagebox, font 
 import threading
+import queue
 import sys
 import os
+import pickle
 import time 
-from typing import Optional, Dict, Any, List 
-from dataclasses import asdict
-
-#adiciona o diretorio pai ao path para import os modulos
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Set
+from dataclasses import fields
+from functools import lru_cache, partial
 
+#a raiz do projeto ja esta no sys.path (main.py e o ponto de entrada)
 try:
     from modules.mouse_detector import MouseDetector, MouseInfo
     from modules.system_settings import SystemMouseSettings, MouseSettings, MouseAcceleration
+    from modules import system_events
 except ImportError as e:
     print(f"erro ao importar modulos: {e}")
     sys.exit(1)
     
+#backup persistente das configuracoes (carregado so no primeiro restore)
+_BACKUP_PATH = os.path.join(os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'),
+                            'mouse_manager', 'backup.pkl')
+
+@lru_cache(maxsize=None)
+def _init_field_names(cls) -> tuple:
+    """Nomes dos campos de init de um dataclass, resolvidos uma vez por classe"""
+    return tuple(f.name for f in fields(cls) if f.init)
+    
+def _fields_dict(obj) -> Dict[str, Any]:
+    """Campos de init de um dataclass plano, sem a copia profunda de asdict"""
+    return {name: getattr(obj, name) for name in _init_field_names(type(obj))}
+
+#poucos mouses por varredura: o LRU descarta os que foram desconectados
+@lru_cache(maxsize=128)
+def _row_values(mouse: MouseInfo) -> tuple:
+    """Colunas do treeview para um mouse (MouseInfo e frozen/hashable)"""
+    return (
+        mouse.name,
+        mouse.manufacturer,
+        mouse.vendor_id,
+        mouse.product_id,
+        mouse.connection_type,
+        mouse.serial_number,
+        mouse.release_number
+    )
+    
+@lru_cache(maxsize=128)
+def _sort_keys(values: tuple) -> tuple:
+    """Chaves de ordenacao de cada coluna de uma linha, calculadas uma vez por linha"""
+    return tuple(str(value).casefold() for value in values)
+    
 class MouseManagerGUI:
     """
     Interface grafica principal do MouseManager
     Fornece uma experiencia completa de gerenciamento de mouses
     """
     
+    #tamanho inicial da janela (largura, altura)
+    WINDOW_SIZE = (1000, 700)
+    
+    #linhas mantidas no log de atividades
+    LOG_MAX_LINES = 1000
+    
+    #modos do auto-refresh: intervalo fixo em ms ou None para adaptativo
+    REFRESH_MODES = {
+        "Adaptativo": None,
+        "3 s": 3000,
+        "5 s": 5000,
+        "10 s": 10000,
+        "30 s": 30000,
+    }
+    
+    #nomes dos niveis de aceleracao para o log
+    ACCEL_LEVEL_NAMES = {
+        MouseAcceleration.LOW: "Baixo",
+        MouseAcceleration.MEDIUM: "Médio",
+        MouseAcceleration.HIGH: "Alto",
+    }
+    
+    #limiares/fator gravados por "Aplicar" conforme a aceleracao esta ligada ou nao
+    ACCEL_PARAMS = {
+        True: {'acceleration_threshold1': 6, 'acceleration_threshold2': 10, 'acceleration_factor': 1},
+        False: {'acceleration_threshold1': 0, 'acceleration_threshold2': 0, 'acceleration_factor': 0},
+    }
+    
+    #texto fixo da aba sobre; ja vem quebrado em linhas, entao o label
+    #nao usa wraplength e nao re-mede o texto a cada redimensionamento
+    ABOUT_TEXT = """
+Funcionalidades:
+- Deteccao automatica de mouses HID
+- Configuracao de velocidade e aceleracao
+- Contole de duplo Clique e scroll
+- Backup e restauracao de configuracoes
+- Interface moderna e intuitiva
+
+Tecnologias:
+- Python
+- TKinter
+- HIDAPI
+- ctypes
+
+Requisitos:
+- Windows 10/11
+- Python 3.7 ou superior
+- Biblioteca hidapi
+
+Desenvolvido como MVP
+para demonstracao de capacidades de deteccao
+e configuracao de mouses genericos.
+
+Seguranca:
+- Apenas le informacoes de dispositivos HID
+- Modifica apenas configuracoes padrao do Windows
+- Nao instala drivers ou altera arquivos do sistema
+"""
+    
     def __init__(self, root):
         """Inicializa a interface grafica"""
-        self.root = tk.Tk()
+        self.root = root
         self.setup_window()
         
         #inicializa os modulos
@@ -39,35 +135,114 @@ class MouseManagerGUI:
             self.mouse_detector = MouseDetector()
             self.system_settings = SystemMouseSettings()
         except Exception as e:
+            #esconde a janela ainda vazia antes do dialogo; nenhum after foi agendado
+            #ate aqui, entao destroy nao deixa timers do Tcl para tras
+            self.root.withdraw()
             messagebox.showerror("Erro de inicializacao",
-                                 f"Erro ao inicializar modulos:\n {e}")
+                                 f"Erro ao inicializar modulos:\n {e}", parent=self.root)
             self.root.destroy()
-            return
+            #como na falha de import: o chamador nao deve seguir com a raiz destruida
+            #nem mostrar um segundo dialogo de erro
+            sys.exit(1)
         
         #variaveis de controle
         self.current_settings: Optional[MouseSettings] = None
         self.settings_backup: Optional[MouseSettings] = None
         self.auto_refresh_enable = tk.BooleanVar(value=True)
-        self.refresh_interval = 5000 #5secs
+        self.refresh_interval = 5000 #intervalo atual do polling
         self.refresh_job = None
+        self._last_refresh = 0.0 #time.monotonic() previsto da ultima varredura automatica
+        
+        #o auto-refresh so varre com a aba de deteccao visivel
+        self._visible_tab = "Mouses Detectados"
+        self._tab_paused = False
+        
+        #polling adaptativo: o intervalo dobra a cada varredura sem mudancas
+        self._min_interval = 1000
+        self._max_interval = 30000
+        self._idle_streak = 0
+        self.system_events_active = False
+        self._pending_system_events = set()
+        #rajadas de WM_DEVICECHANGE (dock, hub USB) viram uma unica varredura
+        self._device_event_job = None
+        self.device_event_delay = 200 #ms sem novos eventos antes de varrer
+        
+        #worker unico para as acoes em segundo plano (chamadas Win32 de configuracao,
+        #verificacoes, backup): tira as syscalls do mainloop, mantem leituras e
+        #gravacoes na ordem em que foram pedidas e evita uma thread nova por acao
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SystemSettings")
+        self._settings_future = None #ultima leitura de configuracoes enviada ao worker
+        
+        #janela de detalhes reaproveitada entre chamadas (None quando fechada)
+        self._detail_window: Optional[tk.Toplevel] = None
+        self._detail_text: Optional[tk.Text] = None
+        
+        #resultados da deteccao chegam por esta fila e so sao aplicados na thread do tk
+        self._result_q = queue.Queue()
+        #a fila e lida a cada 15 ms enquanto ha trafego; ciclos vazios dobram a espera
+        #ate 250 ms, e com a janela minimizada a leitura para (volta no _on_show)
+        self._pump_interval = 15 #ms
+        self._pump_max_interval = 250 #ms
+        self._pump_delay = self._pump_interval
+        self._pump_job = None
+        
+        #thread de deteccao unica e duradoura: acorda a cada pedido de varredura;
+        #pedidos feitos durante uma varredura viram so mais uma no final
+        self._scan_request = threading.Event()
+        self._detect_stop = threading.Event()
+        self._detect_thread: Optional[threading.Thread] = None
+        self._force_scan = False
+        #quem espera a duracao da proxima varredura forcada (teste de performance);
+        #o lock mantem o pedido de forca e os que esperam por ele juntos
+        self._scan_waiters: List[Future] = []
+        self._scan_lock = threading.Lock()
+        
+        #linhas do treeview por path do dispositivo: (iid, valores exibidos)
+        self._row_by_key: Dict[str, tuple] = {}
+        self._mouse_by_iid: Dict[str, MouseInfo] = {}
+        self._row_order: tuple = () #iids na ordem exibida
+        self._sort_by: Optional[tuple] = None #(indice da coluna, decrescente)
+        self._last_detail_key = None
+        self._displayed_mice: Optional[tuple] = None #ultima lista aplicada ao treeview
+        
+        #abas montadas sob demanda e o que foi produzido para elas antes de existirem
+        self._tab_built = set()
+        #entradas de log ainda nao escritas no widget (anel: as mais antigas caem)
+        self._log_pending = deque(maxlen=self.LOG_MAX_LINES)
+        #copia das linhas que estao no widget: "Salvar Log" grava daqui sem ler o Text
+        self._log_lines = deque(maxlen=self.LOG_MAX_LINES)
+        self._system_info_display = ""
         
         #variaveis da interface
         self.setup_variables()
         
         #configura a interface
-        self.setup_ui()
+        #estilos e fontes nomeadas antes dos widgets que os usam
         self.setup_styles()
+        self.setup_ui()
+        
+        #drena a fila de resultados das threads de deteccao
+        self._queue_handlers = {
+            'mice': self._update_mice_display,
+            'error': self._on_worker_error,
+            'status': self._set_status,
+            #fora do laco da fila: um messagebox modal nao segura os outros resultados
+            'call': self.root.after_idle,
+        }
+        self._pump_queue()
         
         #carrega dados inicias
         self.load_initial_data()
         
-        #iniciar refresh automatico
+        #eventos do Windows: dispositivo conectado/removido e configuracao alterada
+        self.setup_system_events()
+        
+        #iniciar refresh automatico (polling apenas como fallback sem eventos)
         self.start_auto_refresh()
         
     def setup_window(self):
         """Configura a janela principal"""
         self.root.title("Mouse Manager MVP - Gerenciador Universal de Mouses")
-        self.root.geometry("1000x700")
         self.root.minsize(800, 600)
         self.root.resizable(True, True)
         
@@ -84,13 +259,17 @@ class MouseManagerGUI:
         #configura o fechamento da janela
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
+        #janela minimizada: nada de refresh ate ela voltar
+        self._paused = False
+        self.root.bind('<Unmap>', self._on_hide)
+        self.root.bind('<Map>', self._on_show)
+        
     def center_window(self):
         """Centraliza a janela na tela"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        #o tamanho e o nosso: sem update_idletasks/winfo_width para descobri-lo
+        width, height = self.WINDOW_SIZE
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
         self.root.geometry(f"{width}x{height}+{x}+{y}")
         
     def setup_variables(self):
@@ -103,19 +282,80 @@ class MouseManagerGUI:
         self.wheel_lines_var = tk.IntVar(value=3)
         self.hover_time_var = tk.IntVar(value=400)
         
+        #modo do auto-refresh (chave de REFRESH_MODES)
+        self._mode = tk.StringVar(value="Adaptativo")
+        
         #variaveis de status
         self.status_var = tk.StringVar(value="Inicializando...")
         self.mice_count_var = tk.StringVar(value="0 mouses detectados")
         
-        #bind para mudancas automaticas
-        self.speed_var.trace('w', self.on_settings_change)
-        self.dclick_var.trace('w', self.on_settings_change)
-        self.wheel_lines_var.trace('w', self.on_settings_change)
-        self.hover_time_var.trace('w', self.on_settings_change)
+        #barra de status: ultimo texto aplicado e o que espera a janela de 100 ms
+        self._status_text = "Inicializando..."
+        self._status_pending = self._status_text
+        self._status_time = 0.0
+        self._status_job = None
+        self._shown_summary: Optional[tuple] = None #(contagem, resumo de conexoes)
+        self._admin_shown: Optional[tuple] = None #(texto, estilo) do indicador de admin
+        
+        #controle dos traces: atualizacoes feitas pelo programa nao contam como mudanca
+        #_last_written guarda o ultimo valor lido/gravado no Windows por campo
+        self._suppress_trace = False
+        self._last_written: Dict[str, int] = {}
+        
+        #campos mexidos desde a ultima aplicacao; nada e gravado ate o "Aplicar"
+        #o trace so marca o campo; os valores sao lidos quando alguem pergunta
+        self._pending_changes: Set[str] = set()
+        
+        #ultimo valor inteiro mostrado no label de cada Scale (por campo)
+        self._shown_labels: Dict[str, int] = {}
+        #valores que esperam o proximo idle para ir aos labels
+        self._label_pending: Dict[str, int] = {}
+        self._label_job = None
+        self._label_time = 0.0
+        
+        #nome da variavel Tcl -> (campo, variavel)
+        self._trace_fields = {
+            str(var): (name, var) for name, var in (
+                ('speed', self.speed_var),
+                ('double_click_speed', self.dclick_var),
+                ('wheel_scroll_lines', self.wheel_lines_var),
+                ('hover_time', self.hover_time_var),
+                ('acceleration_enable', self.accel_var),
+                ('swap_buttons', self.swap_buttons_var),
+            )
+        }
+        
+        self._field_vars = dict(self._trace_fields.values())
+        
+        #traces so registram o que o usuario mexeu (mudancas nao aplicadas);
+        #nada e gravado no Windows por eles
+        for var in self._field_vars.values():
+            var.trace_add('write', self.on_settings_change)
+            
+    @contextmanager
+    def _no_trace(self):
+        """Desliga on_settings_change enquanto as variaveis sao atualizadas pelo programa"""
+        previous = self._suppress_trace
+        self._suppress_trace = True
+        try:
+            yield
+        finally:
+            self._suppress_trace = previous
+            
+    def _remember_written(self, settings: MouseSettings):
+        """Registra os valores que estao no Windows para os campos com trace"""
+        self._last_written.update({
+            'speed': settings.speed,
+            'double_click_speed': settings.double_click_speed,
+            'wheel_scroll_lines': settings.wheel_scroll_lines,
+            'hover_time': settings.hover_time,
+            'acceleration_enable': int(settings.acceleration_enable),
+            'swap_buttons': int(settings.swap_buttons),
+        })
         
     def setup_styles(self):
         """COnfigura estilos personalizados"""
-        style = ttk.Style()
+        style = ttk.Style(self.root)
         
         #configura o tema
         try:
@@ -123,13 +363,28 @@ class MouseManagerGUI:
         except:
             pass
         
-        # estilos personalizados
-        style.configure('Title.TLabel', font=('Arial', 12, 'bold'))
-        style.configure('Subtitle.TLabel', font=('Arial', 10, 'bold'))
-        style.configure('Info,TLabel', font=('Arial', 9))
-        style.configure('Success.TLabel', foreground='green')
-        style.configure('Error.TLabel', foreground='red')
-        style.configure('Warning.TLabel', foreground='orange')
+        #fontes nomeadas: o Tk resolve cada uma uma vez e os estilos so referenciam o nome
+        #(o objeto Font precisa viver, senao o tkinter apaga a fonte do Tcl)
+        self._fonts = [
+            font.Font(root=self.root, name='MMTitle', family='Arial', size=12, weight='bold'),
+            font.Font(root=self.root, name='MMSubtitle', family='Arial', size=10, weight='bold'),
+            font.Font(root=self.root, name='MMInfo', family='Arial', size=9),
+            font.Font(root=self.root, name='MMBody', family='Arial', size=10),
+            font.Font(root=self.root, name='MMVersion', family='Arial', size=12),
+            font.Font(root=self.root, name='MMHeading', family='Arial', size=16, weight='bold'),
+            font.Font(root=self.root, name='MMMono', family='Consolas', size=9),
+            font.Font(root=self.root, name='MMMonoSmall', family='Consolas', size=8),
+        ]
+        
+        # estilos personalizados (um unico script Tcl em vez de uma chamada por estilo)
+        self.root.tk.eval(
+            "ttk::style configure Title.TLabel -font MMTitle\n"
+            "ttk::style configure Subtitle.TLabel -font MMSubtitle\n"
+            "ttk::style configure Info.TLabel -font MMInfo\n"
+            "ttk::style configure Success.TLabel -foreground green\n"
+            "ttk::style configure Error.TLabel -foreground red\n"
+            "ttk::style configure Warning.TLabel -foreground orange\n"
+        )
         
     def setup_ui(self):
         """Configura a interface do usuario"""
@@ -144,15 +399,45 @@ class MouseManagerGUI:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
         
-        # cnofgura as abas
-        self.setup_detection_tab()
-        self.setup_settings_tab()
-        self.setup_advanced_tab()
-        self.setup_about_tab()
+        # cnofgura as abas: so a de deteccao e montada agora, as outras na primeira visita
+        self._tab_builders = {
+            "Mouses Detectados": self.setup_detection_tab,
+            "Configuracoes": self.setup_settings_tab,
+            "Avancado": self.setup_advanced_tab,
+            "Sobre": self.setup_about_tab,
+        }
+        self._tab_frames = {}
+        for name in self._tab_builders:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=name)
+            self._tab_frames[name] = frame
+            
+        self._build_tab("Mouses Detectados")
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         #barra de status
         self.setup_status_bar(main_frame)
         
+    def _build_tab(self, name: str):
+        """Monta o conteudo de uma aba uma unica vez"""
+        if name in self._tab_built:
+            return
+        self._tab_built.add(name)
+        self._tab_builders[name]()
+        
+    def _on_tab_changed(self, event=None):
+        """Monta a aba selecionada na primeira vez que ela aparece"""
+        name = self.notebook.tab(self.notebook.select(), 'text')
+        self._visible_tab = name
+        self._build_tab(name)
+        
+        #de volta a aba de deteccao depois de uma pausa: atualiza e retoma o timer
+        if name == "Mouses Detectados" and self._tab_paused:
+            self._tab_paused = False
+            if self.auto_refresh_enable.get() and not self._paused:
+                self.refresh_mice_list(force=False)
+                self.start_auto_refresh()
+        
     def setup_toolbar(self, parent):
         """Configura a toolbar"""
         toolbar = ttk.Frame(parent)
@@ -167,27 +452,30 @@ class MouseManagerGUI:
         buttom_frame = ttk.Frame(toolbar)
         buttom_frame.pack(side=tk.RIGHT)
         
-        ttk.Button(buttom_frame, text="Atualizar Tudo",
-                   command=self.refresh_all_data).pack(side=tk.LEFT, padx=2)
-        
-        ttk.Button(buttom_frame, text="Backup",
-                   command=self.create_backup).pack(side=tk.LEFT, padx=2)
-        
-        ttk.Button(buttom_frame, text="Restaurar",
-                   command=self.restore_backup).pack(side=tk.LEFT, padx=2)
-        
-        ttk.Button(buttom_frame, text="Padroes",
-                   command=self.restore_defaults).pack(side=tk.LEFT, padx=2)
+        toolbar_buttons = (
+            ("Atualizar Tudo", self.refresh_all_data),
+            ("Backup", self.create_backup),
+            ("Restaurar", self.restore_backup),
+            ("Padroes", self.restore_defaults),
+        )
+        left = tk.LEFT
+        for text, command in toolbar_buttons:
+            ttk.Button(buttom_frame, text=text, command=command).pack(side=left, padx=2)
         
         #checkbox para auto-refresh
         ttk.Checkbutton(buttom_frame, text="Auto-refresh",
                         variable=self.auto_refresh_enable,
                         command=self.toggle_auto_refresh).pack(side=tk.LEFT, padx=5)
         
+        #intervalo do auto-refresh
+        mode_combo = ttk.Combobox(buttom_frame, textvariable=self._mode, state='readonly',
+                                  values=list(self.REFRESH_MODES), width=10)
+        mode_combo.pack(side=tk.LEFT, padx=2)
+        mode_combo.bind('<<ComboboxSelected>>', self.on_refresh_mode_change)
+        
     def setup_detection_tab(self):
         """Configura a aba de deteccao de mouses"""
-        detection_frame = ttk.Frame(self.notebook)
-        self.notebook.add(detection_frame, text="Mouses Detectados")
+        detection_frame = self._tab_frames["Mouses Detectados"]
         
         #Frame superior com informacoes e controles
         top_frame = ttk.Frame(detection_frame)
@@ -209,12 +497,13 @@ class MouseManagerGUI:
         control_frame = ttk.Frame(top_frame)
         control_frame.pack(side="right")
         
-        ttk.Button(control_frame, text="Atualizar Lista",
-                   command=self.refresh_mice_list).pack(pady=2)
-        ttk.Button(control_frame, text="Detalhes",
-                   command=self.show_detailed_info).pack(pady=2)
-        ttk.Button(control_frame, text="Exportar",
-                   command=self.export_mice_info).pack(pady=2)
+        control_buttons = (
+            ("Atualizar Lista", self.refresh_mice_list),
+            ("Detalhes", self.show_detailed_info),
+            ("Exportar", self.export_mice_info),
+        )
+        for text, command in control_buttons:
+            ttk.Button(control_frame, text=text, command=command).pack(pady=2)
         
         #Treeview para mostrar mouses
         tree_frame = ttk.LabelFrame(detection_frame, text="Dispositivos Detectados")
@@ -223,6 +512,7 @@ class MouseManagerGUI:
         #configuracao do treeview
         colums = ('Nome', 'Fabricante', 'VID', 'PID', 'Conexao', 'Serial', 'Release')
         self.mice_tree = ttk.Treeview(tree_frame, columns=colums, show='headings', height=8)
+        self._tree_columns = colums
         
         #configurar colunas
         column_widths = {'Nome': 200, 'Fabricante': 150, 'VID': 80, 'PID': 80,
@@ -237,12 +527,12 @@ class MouseManagerGUI:
         tree_scroll_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         v_scrollbar = ttk.Scrollbar(tree_scroll_frame, orient=tk.VERTICAL,
-                                    command=self.mice_tree_yview)
+                                    command=self.mice_tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_scroll_frame, orient=tk.HORIZONTAL,
-                                    comand=self.mice_tree.xview)
+                                    command=self.mice_tree.xview)
         
-        self.mice_tree.configure(yscrollcommand=v_scrollbar.self,
-                                 xcrollcommand=h_scrollbar.set)
+        self.mice_tree.configure(yscrollcommand=v_scrollbar.set,
+                                 xscrollcommand=h_scrollbar.set)
         
         #pack treeview e scrollbars
         self.mice_tree.grid(row=0, column=0, sticky='nsew')
@@ -256,9 +546,8 @@ class MouseManagerGUI:
         detail_frame = ttk.LabelFrame(detection_frame, text="Informacoes Detalhadas")
         detail_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        self.into_text = scrolledtext.ScolledText(detail_frame, height=6, wrap=tk.WORD,
-                                                  font=('Consolas', 9))
-        self.info_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.info_text = self._scrolled_text(detail_frame, height=6, font='MMMono',
+                                             state=tk.DISABLED, insertofftime=0)
         
         #bind para selecao na arvore
         self.mice_tree.bind('<<TreeviewSelect>>', self.on_mouse_select)
@@ -266,20 +555,15 @@ class MouseManagerGUI:
         
     def setup_settings_tab(self):
         """Configura a aba de configuracoes do sistema"""
-        settings_frame = ttk.Frame(self.notebook)
-        self.notebook.add(settings_frame, text="Configuracoes")
+        settings_frame = self._tab_frames["Configuracoes"]
         
-        #Frame principal com scroll
-        canvas = tk.Canvas(settings_frame)
-        scrollbar = tk.Scrollbar(settings_frame, orient="vertical", command=canvas.yview)
+        #Frame principal com scroll: a barra e a roda so entram quando o conteudo
+        #nao cabe na aba
+        canvas = tk.Canvas(settings_frame, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(settings_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_windoe((0, 0), window=scrollable_frame, anchor="nw")
+        window_id = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         #configuracoes principais
@@ -291,12 +575,69 @@ class MouseManagerGUI:
         #botao de acao
         self.setup_action_buttons(scrollable_frame)
         
-        #pack canvas e scrollbar
         canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
         
-        #bind mouse whell
-        canvas.bind_all("<MouseWheel>", lambda e: canvas.yview_scoll(int(-1*(e.delta/120)), "units"))
+        #bind mouse whell: so enquanto o ponteiro esta sobre o canvas
+        yview_scroll = canvas.yview_scroll
+        def on_wheel(event):
+            #120 por "clique" da roda; deltas menores (touchpad) ainda andam uma linha
+            yview_scroll(-(event.delta // 120) or (-1 if event.delta > 0 else 1), "units")
+            
+        #estado do scroll: job agendado, ultima regiao aplicada e se ha overflow
+        scroll = {'job': None, 'region': None, 'overflow': False}
+        def on_enter(event):
+            if scroll['overflow']:
+                canvas.bind_all('<MouseWheel>', on_wheel)
+                
+        def update_scroll():
+            scroll['job'] = None
+            height = scrollable_frame.winfo_reqheight()
+            needed = height > canvas.winfo_height()
+            
+            #a regiao so e reaplicada quando muda
+            region = (0, 0, canvas.winfo_width(), height if needed else 0)
+            if region != scroll['region']:
+                scroll['region'] = region
+                canvas.configure(scrollregion=region)
+                
+            if needed == scroll['overflow']:
+                return
+            scroll['overflow'] = needed
+            if needed:
+                scrollbar.pack(side="right", fill="y")
+            else:
+                #o conteudo voltou a caber com o ponteiro sobre o canvas: a roda
+                #ficaria ligada ate o proximo <Leave> rolando uma regiao vazia
+                canvas.unbind_all('<MouseWheel>')
+                canvas.yview_moveto(0)
+                scrollbar.pack_forget()
+                
+        def on_resize(event):
+            #o frame interno acompanha a largura da aba
+            if event.widget is canvas:
+                canvas.itemconfigure(window_id, width=event.width)
+                
+            #uma rajada de <Configure> (redimensionar a janela) vira um unico calculo
+            if scroll['job'] is None:
+                scroll['job'] = canvas.after_idle(update_scroll)
+                
+        scrollable_frame.bind("<Configure>", on_resize)
+        canvas.bind("<Configure>", on_resize)
+        canvas.bind('<Enter>', on_enter)
+        canvas.bind('<Leave>', lambda e: canvas.unbind_all('<MouseWheel>'))
+        #trocar de aba (ex.: Ctrl+Tab) com o ponteiro sobre o canvas nao gera <Leave>
+        canvas.bind('<Unmap>', lambda e: canvas.unbind_all('<MouseWheel>'))
+        
+        #campo -> (configure do label, formato do texto), resolvidos uma vez aqui
+        self._scale_labels = {
+            'speed': (self.speed_label.configure, "%d"),
+            'double_click_speed': (self.dclick_label.configure, "%d ms"),
+            'wheel_scroll_lines': (self.wheel_label.configure, "%d"),
+            'hover_time': (self.hover_label.configure, "%d ms"),
+        }
+        
+        #aba montada depois das configuracoes carregadas: labels saem das variaveis
+        self._refresh_setting_labels()
         
     def setup_speed_settings(self, parent):
         """Configura controles de velocidade"""
@@ -319,14 +660,12 @@ class MouseManagerGUI:
         preset_frame = ttk.Frame(speed_frame)
         preset_frame.pack(fill=tk.X, padx=5, pady=2)
         
-        ttk.Button(preset_frame, text="Lento", width=8,
-                   command=lambda: self.speed_var.set(5)).pack(side=tk.LEFT, padx=2)
-        ttk.Button(preset_frame, text="Normal", width=8,
-                   command=lambda: self.speed_var.set(10)).pack(side=tk.LEFT, padx=2)
-        ttk.Button(preset_frame, text="Rapido", width=8,
-                   command=lambda: self.speed_var.set(15)).pack(side=tk.LEFT, padx=2)
-        ttk.Button(preset_frame, text="Muito Rapido", width=8,
-                   command=lambda: self.speed_var.set(20)).pack(side=tk.LEFT, padx=2)
+        speed_presets = (("Lento", 5), ("Normal", 10), ("Rapido", 15), ("Muito Rapido", 20))
+        left = tk.LEFT
+        set_speed = self.speed_var.set
+        for text, speed in speed_presets:
+            ttk.Button(preset_frame, text=text, width=8,
+                       command=lambda speed=speed: set_speed(speed)).pack(side=left, padx=2)
         
     def setup_acceleration_settings(self, parent):
         """Configura controles de aceleracao"""
@@ -344,11 +683,11 @@ class MouseManagerGUI:
         
         ttk.Label(level_frame, text="Nivel:").pack(side=tk.LEFT)
         
-        ttk.Button(level_frame, txt="Baixo", width=8,
+        ttk.Button(level_frame, text="Baixo", width=8,
                     command=lambda: self.set_acceleration_level(MouseAcceleration.LOW)).pack(side=tk.LEFT, padx=2)
-        ttk.Button(level_frame, txt="Medio", width=8,
+        ttk.Button(level_frame, text="Medio", width=8,
                     command=lambda: self.set_acceleration_level(MouseAcceleration.MEDIUM)).pack(side=tk.LEFT, padx=2)
-        ttk.Button(level_frame, txt="Alto", width=8,
+        ttk.Button(level_frame, text="Alto", width=8,
                     command=lambda: self.set_acceleration_level(MouseAcceleration.HIGH)).pack(side=tk.LEFT, padx=2)
         
         #informacoes sobre
@@ -372,7 +711,7 @@ class MouseManagerGUI:
         dclick_control_frame.pack(fill=tk.X, pady=2)
         
         self.dclick_scale = ttk.Scale(dclick_control_frame, from_=100, to=900, orient=tk.HORIZONTAL,
-                                      variable=self.dclick_var, command=self.on_click_change)
+                                      variable=self.dclick_var, command=self.on_dclick_change)
         self.dclick_scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         self.dclick_label = ttk.Label(dclick_control_frame, text="500ms", width=8)
@@ -388,7 +727,7 @@ class MouseManagerGUI:
                         command=self.on_button_swap_change).pack(anchor=tk.W, padx=5, pady=5)
         
     def setup_advanced_settings(self, parent):
-        """Configura configuracoes avancadas"""
+        """Configura o grupo de roda/hover da aba de configuracoes (nao e a aba Avancado)"""
         advanced_frame = ttk.LabelFrame(parent, text="Configuracoes Avancadas")
         advanced_frame.pack(fill=tk.X, padx=10, pady=5)
         
@@ -426,15 +765,16 @@ class MouseManagerGUI:
         
     def setup_action_buttons(self, parent):
         """Configura botoes de acao"""
-        button_frame = ttk.LabelFrame(parent, tect="Acoes")
+        button_frame = ttk.LabelFrame(parent, text="Acoes")
         button_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # Primeira linha de botoes
         row1 = ttk.Frame(button_frame)
         row1.pack(fill=tk.X, padx=5, pady=2)
         
-        ttk.Button(row1, text="Aplicar configuracoes", 
-                   command=self.apply_settings).pack(side=tk.LEFT, padx=2)
+        self.apply_button = ttk.Button(row1, text="Aplicar configuracoes", 
+                                       command=self.apply_settings)
+        self.apply_button.pack(side=tk.LEFT, padx=2)
         ttk.Button(row1, text="Atualizar",
                    command=self.load_current_settings).pack(side=tk.LEFT, padx=2)
         ttk.Button(row1, text="Restaurar Padroes",
@@ -452,17 +792,15 @@ class MouseManagerGUI:
                    command=self.show_settings_summary).pack(side=tk.LEFT, padx=2)
         
     def setup_advanced_tab(self):
-        """Configura a aba de configuracoes avancadas"""
-        advanced_frame = ttk.Frame(self.notebook)
-        self.notebook.add(advanced_frame, text="Avancado")
+        """Configura a aba Avancado (informacoes do sistema, diagnostico e log)"""
+        advanced_frame = self._tab_frames["Avancado"]
         
         #informacoes do sistema
         system_frame = ttk.LabelFrame(advanced_frame, text="Informacoes do Sistema")
         system_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.system_info_text = scrolledtext.ScolledText(system_frame, height=8, wrap=tk.WORD,
-                                                         font=('Consolas', 9))
-        self.system_info_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.system_info_text = self._scrolled_text(system_frame, height=8, font='MMMono',
+                                                    state=tk.DISABLED, insertofftime=0)
         
         #ferramentas de diagnostico
         diag_frame = ttk.LabelFrame(advanced_frame, text="Ferramentas de Diagnostico")
@@ -477,14 +815,18 @@ class MouseManagerGUI:
                    command=self.show_hid_stats).pack(side=tk.LEFT, padx=2)
         ttk.Button(diag_buttons, text="Teste de Performace",
                    command=self.run_performance_test).pack(side=tk.LEFT, padx=2)
+        #as informacoes do sistema nao mudam sozinhas: so sao relidas a pedido
+        ttk.Button(diag_buttons, text="Recarregar Info",
+                   command=lambda: self.load_system_info(reload=True)).pack(side=tk.LEFT, padx=2)
         
         #log de atividades
         log_frame = ttk.LabelFrame(advanced_frame, text="Log de Atividades")
         log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=10, wrap=tk.WORD,
-                                                  font=('Consolas', 8))
-        self.log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        #somente leitura: _flush_log e clear_log liberam a escrita so durante a edicao
+        self.log_text = self._scrolled_text(log_frame, height=10, font='MMMonoSmall',
+                                            state=tk.DISABLED, insertofftime=0,
+                                            exportselection=False)
         
         #bootes do log
         log_buttons = ttk.Frame(log_frame)
@@ -495,54 +837,47 @@ class MouseManagerGUI:
         ttk.Button(log_buttons, text="Salvar Log",
                    command=self.save_log).pack(side=tk.LEFT, padx=2)
         
+        #conteudo produzido antes da aba existir; as informacoes do sistema so sao
+        #montadas quando a aba e aberta pela primeira vez
+        if self._system_info_display:
+            self._update_system_info_display(self._system_info_display)
+        else:
+            self.load_system_info()
+        self._flush_log()
+        
+    def _scrolled_text(self, parent, padding: int = 5, **options) -> tk.Text:
+        """Cria um Text com ttk.Scrollbar, ja empacotado no pai, sem pilha de undo"""
+        #os textos da interface sao escritos pelo programa: desfazer so guardaria copias
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.BOTH, expand=True, padx=padding, pady=padding)
+        
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL)
+        text = tk.Text(frame, wrap=tk.WORD, undo=False, maxundo=0, autoseparators=False,
+                       yscrollcommand=scrollbar.set, **options)
+        scrollbar.configure(command=text.yview)
+        
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        return text
+        
     def setup_about_tab(self):
         """Configura a aba sobre"""
-        about_frame = ttk.Frame(self.notebook)
-        self.notebook.add(about_frame, text="Sobre")
+        about_frame = self._tab_frames["Sobre"]
         
         #titulo e versao
         title_frame = ttk.Frame(about_frame)
         title_frame.pack(fill=tk.X, padx=20, pady=20)
         
         ttk.Label(title_frame, text="Mouse Manager MPV",
-                  font=('Arial', 16, 'bold')).pack()
+                  font='MMHeading').pack()
         ttk.Label(title_frame, text="Versao 1.0.0",
-                  font=('Arial', 12)).pack(pady=5)
+                  font='MMVersion').pack(pady=5)
         ttk.Label(title_frame, text="Software Universal apra gerenciamento de Mouses Genericos",
-                  font=('Arial', 10)).pack()
+                  font='MMBody').pack()
         
         #informacoes
-        info_text = """
-Funcionalidades:
-- Deteccao automatica de mouses HID
-- Configuracao de velocidade e aceleracao
-- Contole de duplo Clique e scroll
-- Backup e restauracao de configuracoes
-- Interface moderna e intuitiva
-
-Tecnologias:
-- Python
-- TKinter
-- HIDAPI
-- ctypes
-
-Requisitos:
-- Windows 10/11
-- Python 3.7 ou superior
-- Biblioteca hidapi
-
-Desenvolvido como MVP
-para demonstracao de capacidades de deteccao
-e configuracao de mouses genericos.
-
-Seguranca:
-- Apenas le informacoes de dispositivos HID
-- Modifica apenas configuracoes padrao do Windows
-- Nao instala drivers ou altera arquivos do sistema
-        """
-        
-        info_label = ttk.LAbel(about_frame, text=info_text, justify=tk.LEFT,
-                               font=('Arial', 9))
+        info_label = ttk.Label(about_frame, text=self.ABOUT_TEXT, justify=tk.LEFT,
+                               font='MMInfo')
         info_label.pack(padx=20, pady=10, anchor=tk.W)
     
     def setup_status_bar(self, parent):
@@ -552,7 +887,7 @@ Seguranca:
         
         #status principal
         self.status_label = ttk.Label(status_frame, textvariable=self.status_var,
-                                      rlief=tk.SUNKEN, anchor=tk.W)
+                                      relief=tk.SUNKEN, anchor=tk.W)
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         #indicador de admin
@@ -564,76 +899,233 @@ Seguranca:
         
     def load_initial_data(self):
         """Carrega dados inicais"""
-        def load_in_thread():
-            try:
-                self.status_var.set("Carregando configuracoes...")
-                self.load_current_settings()
-                
-                self.status_var.set("Detectando mouses...")
-                self.refresh_mice_list()
-                
-                self.status_var.set("Carregando informacoes do sistema...")
-                self.load_system_info()
-                
-                self.status_var.set("Pronto")
-                self.log_message("sistema inicializado com sucesso")
-                
-            except Exception as e:
-                self.satus_var.set(f"Erro na inicializacao: {e}")
-                self.lof_message(f"Erro na inicializacao: {e}", "ERRO")
-                
-                threading.Thread(target=load_in_thread, daemon=True).start()
+        #as duas cargas ja sao assincronas (worker de configuracoes e thread de
+        #deteccao): nao ha por que abrir outra thread so para dispara-las
+        try:
+            self._set_status("Carregando configuracoes...")
+            self.load_current_settings()
+            self.refresh_mice_list()
+            self.log_message("sistema inicializado com sucesso")
+            
+        except Exception as e:
+            self._set_status(f"Erro na inicializacao: {e}")
+            self.log_message(f"Erro na inicializacao: {e}", "ERROR")
                 
-    def refresh_mice_list(self):
-        """Atualiza a lista de mouses detectados"""
-        def update_in_thread():
+    def refresh_mice_list(self, force: bool = True):
+        """
+        Atualiza a lista de mouses detectados (enumeracao fora da thread do tk)
+        
+        Args:
+            force (bool): ignora o cache do detector; o auto-refresh passa False e
+                          so re-enumera quando o cache expirou ou o SO avisou de mudanca
+        """
+        if self._detect_thread is None:
+            self._detect_thread = threading.Thread(target=self._detect_worker,
+                                                   name="MouseDetection", daemon=True)
+            self._detect_thread.start()
+            
+        #um pedido forcado pendente nao e rebaixado por um do auto-refresh
+        if force:
+            with self._scan_lock:
+                self._force_scan = True
+            if not self._scan_request.is_set():
+                self._result_q.put(('status', "detectando mouses..."))
+        self._scan_request.set()
+        self._wake_pump()
+        
+    def _detect_worker(self):
+        """Enumera os mouses a cada pedido e entrega o resultado pela fila (nao toca em widgets)"""
+        while True:
+            self._scan_request.wait()
+            if self._detect_stop.is_set():
+                return
+            self._scan_request.clear()
+            with self._scan_lock:
+                force, self._force_scan = self._force_scan, False
+                waiters, self._scan_waiters = self._scan_waiters, []
+            
             try:
-                self.status_var.set("detectando mouses...")
-                
-                mice = self.mouse_detector.get_connected_mice(force_refresh=True)
-                
-                #Atualiza a interface na thread principal
-                self.root.after(0, self._update_mice_display, mice)
-                
+                start_time = time.perf_counter()
+                mice = self.mouse_detector.get_connected_mice(force_refresh=force)
+                elapsed = time.perf_counter() - start_time
+                self._result_q.put(('mice', mice))
+                for waiter in waiters:
+                    waiter.set_result(elapsed)
             except Exception as e:
-                self.root.after(0, lambda: self.status_var.set(f"Erro ao detectar mouses: {e}"))
-                self.log_message(f"Erro ao detectar mouses: {e}", "ERROR")
-                
-        threading.Thread(target=update_in_thread, deamo=True).start()
+                self._result_q.put(('error', f"Erro ao detectar mouses: {e}"))
+                for waiter in waiters:
+                    waiter.set_exception(e)
+                    
+    def _timed_scan(self, timeout: float = 30.0) -> float:
+        """Pede uma varredura forcada a thread de deteccao e devolve quanto ela levou"""
+        #o detector so e usado pela thread de deteccao; quem mede so espera por ela
+        if self._detect_thread is None:
+            raise RuntimeError("deteccao ainda nao iniciada")
+        waiter = Future()
+        with self._scan_lock:
+            self._scan_waiters.append(waiter)
+            self._force_scan = True
+        self._scan_request.set()
+        return waiter.result(timeout=timeout)
+            
+    def _pump_queue(self):
+        """Aplica na thread do tk tudo o que as threads de trabalho enviaram"""
+        self._pump_job = None
+        batch = []
+        try:
+            while True:
+                batch.append(self._result_q.get_nowait())
+        except queue.Empty:
+            pass
+        
+        #varreduras acumuladas no mesmo ciclo: so a mais recente vai para o treeview
+        last_mice = max((i for i, (kind, _) in enumerate(batch) if kind == 'mice'), default=-1)
+        try:
+            for i, (kind, data) in enumerate(batch):
+                if kind == 'mice' and i != last_mice:
+                    continue
+                self._queue_handlers[kind](data)
+        except Exception as e:
+            self.log_message(f"Erro ao processar resultado: {e}", "ERROR")
+            
+        #um erro no proprio log nao pode ir para o log (nem parar a fila)
+        try:
+            self._flush_log()
+        except Exception as e:
+            print(f"Erro ao escrever o log: {e}")
+            
+        if batch:
+            self._pump_delay = self._pump_interval
+        else:
+            self._pump_delay = min(self._pump_delay * 2, self._pump_max_interval)
+            
+        #minimizada: o que chegar espera o _on_show
+        if self._paused:
+            return
+        try:
+            self._pump_job = self.root.after(self._pump_delay, self._pump_queue)
+        except tk.TclError:
+            pass #janela ja destruida
+            
+    def _wake_pump(self):
+        """Volta a ler a fila no intervalo curto (thread do tk, ao iniciar um trabalho)"""
+        self._pump_delay = self._pump_interval
+        if self._pump_job is not None:
+            self.root.after_cancel(self._pump_job)
+        self._pump_job = self.root.after(self._pump_interval, self._pump_queue)
+        
+    def _run_in_pool(self, func, *args):
+        """Envia func ao pool de trabalho (thread do tk) e acorda a leitura da fila"""
+        self._wake_pump()
+        return self._pool.submit(func, *args)
+        
+    def _run_on_tk(self, func, *args, **kwargs):
+        """Agenda func(*args) na thread do tk a partir de qualquer thread"""
+        self._result_q.put(('call', partial(func, *args, **kwargs)))
+        
+    def _set_status(self, message: str):
+        """Mostra uma mensagem na barra de status (thread do tk)"""
+        #mensagens em rajada (varredura, aplicacao) viram no maximo uma troca a
+        #cada 100 ms; a ultima sempre chega ao label
+        self._status_pending = message
+        if self._status_job is not None:
+            return
+        wait = 100 - (time.monotonic() - self._status_time) * 1000
+        if wait > 1:
+            self._status_job = self.root.after(int(wait), self._apply_status)
+        else:
+            self._apply_status()
+            
+    def _apply_status(self):
+        """Aplica a mensagem pendente se ela difere da mostrada"""
+        self._status_job = None
+        message = self._status_pending
+        if message == self._status_text:
+            return
+        self._status_text = message
+        self._status_time = time.monotonic()
+        self.status_var.set(message)
+        
+    def _on_worker_error(self, error_msg: str):
+        """Falha numa carga automatica: barra de status e log, sem dialogo modal (thread do tk)"""
+        self._set_status(error_msg)
+        self.log_message(error_msg, "ERROR")
         
     def _update_mice_display(self, mice: List[MouseInfo]):
         """Atualiza a exibicao dos mouses na interface"""
         try:
-            #limpa a arvore
-            for item in self.mice_tree.get_children():
-                self.mice_tree.delete(item)
-                
-            #adicione os mouses detectados
-            for mouse in mice:
-                self.mice_tree.insert('', tk.END, values=(
-                    mouse.name,
-                    mouse.manufacturer,
-                    mouse.vendor_id,
-                    mouse.product_id,
-                    mouse.connection_type,
-                    mouse.serial_number,
-                    mouse.release_number
-                ))
-                
-            #atualiza contadores
+            #uma unica comparacao com a lista exibida serve ao polling adaptativo e ao
+            #atalho abaixo (comparacao real, sem risco de colisao de hash)
+            snapshot = tuple(mice)
+            changed = snapshot != self._displayed_mice
+            self._track_mice_changes(changed)
+            
+            #lista identica a exibida: nenhuma chamada ao Tcl
             count = len(mice)
-            self.mice_count_var.set(f"{count} mouse(s) detectados(s)")
+            if not changed:
+                self._set_status(f"Detectados {count} mouse(s)")
+                return
+            self._displayed_mice = snapshot
+            
+            #diff por path (unico apos _remove_duplicates; VID/PID/serial se repetem
+            #em mouses iguais sem numero de serie)
+            new_rows = {mouse.path: mouse for mouse in mice}
+            tree = self.mice_tree
+            #comandos do Tcl chamados direto, sem a formatacao de opcoes do wrapper ttk
+            call, tree_path = tree.tk.call, tree._w
             
-            #atualiza resumo de conexoes 
+            #linhas que sumiram saem numa unica chamada ao Tcl
+            stale = [self._row_by_key.pop(key)[0] for key in
+                     [key for key in self._row_by_key if key not in new_rows]]
+            if stale:
+                for iid in stale:
+                    #o painel de detalhes mostrava um mouse removido: limpa o painel e
+                    #a proxima selecao volta a escreve-lo
+                    if self._mouse_by_iid.pop(iid, None) == self._last_detail_key:
+                        self._last_detail_key = None
+                        self.info_text.configure(state=tk.NORMAL)
+                        self.info_text.delete('1.0', tk.END)
+                        self.info_text.configure(state=tk.DISABLED)
+                call(tree_path, 'delete', stale)
+                
+            inserted = []
+            for key, mouse in new_rows.items():
+                values = _row_values(mouse)
+                row = self._row_by_key.get(key)
+                
+                if row is None:
+                    iid = call(tree_path, 'insert', '', 'end', '-values', values)
+                    self._row_by_key[key] = (iid, values)
+                    inserted.append(iid)
+                else:
+                    iid = row[0]
+                    if row[1] != values:
+                        call(tree_path, 'item', iid, '-values', values)
+                        self._row_by_key[key] = (iid, values)
+                self._mouse_by_iid[iid] = mouse
+                
+            #linhas novas entram no fim; se a ordem (deteccao ou coluna escolhida) for
+            #outra, reordena tudo numa unica chamada ao Tcl (set_children)
+            order = self._ordered_iids([self._row_by_key[key] for key in new_rows])
+            shown = tuple(iid for iid in self._row_order if iid in self._mouse_by_iid) + tuple(inserted)
+            if order != shown:
+                tree.set_children('', *order)
+            self._row_order = order
+                
+            #atualiza contadores e resumo de conexoes (trocar um mouse por outro do
+            #mesmo tipo nao muda nenhum dos dois)
             summary = self.mouse_detector.get_mouse_summary()
             summary_text = f"USB: {summary['usb']} | Bluetooth: {summary['bluetooth']} | Outro: {summary['outros']}"
-            self.connection_summary_label.config(text=summary_text)
+            if (count, summary_text) != self._shown_summary:
+                self._shown_summary = (count, summary_text)
+                self.mice_count_var.set(f"{count} mouse(s) detectados(s)")
+                self.connection_summary_label.config(text=summary_text)
             
-            self.status_var.set(f"Detectados {count} mouse(s)")
+            self._set_status(f"Detectados {count} mouse(s)")
             self.log_message(f"Detectados {count} mouses(s)")
             
         except Exception as e:
-            self.status_var.set(f"Erro ao ataulizar lista: {e}")
+            self._set_status(f"Erro ao ataulizar lista: {e}")
             self.log_message(f"Erro ao atualizar lista: {e}", "ERROR")
             
     def on_mouse_select(self, event):
@@ -643,25 +1135,17 @@ Seguranca:
             if not selection:
                 return
             
-            item = self.mice_tree.item(selection[0])
-            values=item['values']
-            
-            if len(values) < 4:
+            #o mouse da linha sai direto do indice montado em _update_mice_display
+            selected_mouse = self._mouse_by_iid.get(selection[0])
+            if selected_mouse is None:
                 return
             
-            #encontra o mouse correspondente
-            mice = self. mouse_detector.mice_info
-            selected_mouse = None
+            #a mesma selecao reemitida por um refresh nao reescreve o painel
+            if selected_mouse == self._last_detail_key:
+                return
+            self._last_detail_key = selected_mouse
             
-            for mouse in mice:
-                if (mouse.name == values[0] and
-                    mouse.vendor_id == values[2] and
-                    mouse.product_id == values[3]):
-                    select_mouse = mouse
-                    break
-                
-            if selected_mouse:
-                self.show_mouse_details(selected_mouse)
+            self.show_mouse_details(selected_mouse)
                 
         except Exception as e:
             self.log_message(f"Erro ao selecionar mouse: {e}", "ERROR")
@@ -678,24 +1162,49 @@ Seguranca:
     def show_mouse_details(self, mouse: MouseInfo):
         """Mostra detalhes do mouse selecionado"""
         try:
-            details = ''
+            details = (
+                f"Nome: {mouse.name}\n"
+                f"Fabricante: {mouse.manufacturer}\n"
+                f"VID: {mouse.vendor_id}  PID: {mouse.product_id}  Release: {mouse.release_number}\n"
+                f"Conexao: {mouse.connection_type}  Serial: {mouse.serial_number}\n"
+                f"Interface: {mouse.interface_number}  Usage Page: {mouse.usage_page}  Usage: {mouse.usage}\n"
+                f"Path: {mouse.path}"
+            )
+            
+            #o painel fica somente leitura entre as atualizacoes
+            text = self.info_text
+            text.configure(state=tk.NORMAL)
+            text.delete('1.0', tk.END)
+            text.insert('1.0', details)
+            text.configure(state=tk.DISABLED)
+            
         except Exception as e:
-            pass
+            self.log_message(f"Erro ao mostrar detalhes: {e}", "ERROR")
             
     def load_current_settings(self):
         """Carrega as configuracoes atuais do sistema"""
-        def load_in_thread():
-            try:
-                self.current_settings = self.system_settings.get_current_settings()
-                
-                # atualiza a interface na thread principal
-                self.root.after(0, self._update_settings_display)
-                
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Erro", f"Erro ao carregar configuracoes:\n{e}"))
-                self.log_message(f"Erro ao carregar configuracoes: {e}", "ERROR")
-                
-        threading.Thread(target=load_in_thread, daemon=True).start()
+        #uma leitura ainda na fila (nao comecou) ja vai trazer o valor atual:
+        #cliques repetidos em atualizar nao empilham leituras no worker
+        pending = self._settings_future
+        if pending is not None and not pending.running() and not pending.done():
+            return
+        
+        future = self._run_in_pool(self.system_settings.get_current_settings)
+        future.add_done_callback(self._on_settings_loaded)
+        self._settings_future = future
+        
+    def _on_settings_loaded(self, future):
+        """Recebe o resultado de get_current_settings (thread do worker)"""
+        try:
+            self.current_settings = future.result()
+            
+            # atualiza a interface na thread principal
+            self._run_on_tk(self._update_settings_display)
+            
+        except Exception as e:
+            #a carga roda sozinha (inicio, eventos do sistema, janela restaurada): um
+            #modal aqui pararia o usuario a cada tentativa; vai para a barra de status
+            self._result_q.put(('error', f"Erro ao carregar configuracoes: {e}"))
         
     def _update_settings_display(self):
         """Atualiza a exibicao das configuracoes na interface"""
@@ -704,30 +1213,64 @@ Seguranca:
         
         try:
             #atualiza variaveis sem disparar callbacks
-            self.speed_var.set(self.current_settings.speed)
-            self.accel_vat.set(self.current_settings.acceleraion_enable)
-            self.dclick_var.set(self.current_settings.double_click_speed)
-            self.swap_buttons_var.set(self.current_settings.swap_buttons)
-            self.wheel_lines_vat.set(self.current_settings.wheel_scroll_lines)
-            self.hover_time_vat.set(self.current_settings.hover_time)
+            with self._no_trace():
+                self.speed_var.set(self.current_settings.speed)
+                self.accel_var.set(self.current_settings.acceleration_enable)
+                self.dclick_var.set(self.current_settings.double_click_speed)
+                self.swap_buttons_var.set(self.current_settings.swap_buttons)
+                self.wheel_lines_var.set(self.current_settings.wheel_scroll_lines)
+                self.hover_time_var.set(self.current_settings.hover_time)
+            self._remember_written(self.current_settings)
             
             #atualiza labels
-            self.speed_label.config(text=str(self.current_settings.speed))
-            self.dclick_label.config(text=f"{self.current_settings.double_click_speed} ms")
-            self.wheel_label.config(text=str(self.current_settings.wheel_scroll_lines))
-            self.hover_label.config(text=f"{self.current_settings.hover_time} ms")
+            self._refresh_setting_labels()
             
-            self.status_var.set("Configuracoes carregadas")
+            self._set_status("Configuracoes carregadas")
             self.log_message("Configuracoes carregadas com sucesso")
             
         except Exception as e:
             self.log_message(f"Erro ao atualizar interface: {e}", "ERROR")
             
+    def _refresh_setting_labels(self):
+        """Copia os valores das variaveis para os labels da aba de configuracoes"""
+        if "Configuracoes" not in self._tab_built:
+            return
+        #so os campos com Scale tem label (os checkboxes nao)
+        for name in self._scale_labels:
+            self._set_scale_label(name, self._field_vars[name].get())
+        
     #callbacks para mudancas nas configuracoes
     def on_speed_change(self, value):
         """Callback para mudanca na velocidade"""
-        speed = int(float(value))
-        self.speed_label.config(test=str(speed))
+        self._set_scale_label('speed', int(float(value)))
+        
+    def _set_scale_label(self, name: str, value: int):
+        """Agenda a atualizacao do label de um Scale"""
+        #durante um arraste os passos viram no maximo uma atualizacao a cada 50 ms
+        #(a primeira sai no proximo idle); so o ultimo valor de cada label e aplicado
+        self._label_pending[name] = value
+        if self._label_job is not None:
+            return
+        wait = 50 - (time.monotonic() - self._label_time) * 1000
+        if wait > 1:
+            self._label_job = self.root.after(int(wait), self._flush_scale_labels)
+        else:
+            self._label_job = self.root.after_idle(self._flush_scale_labels)
+            
+    def _flush_scale_labels(self):
+        """Aplica os valores pendentes nos labels dos Scales"""
+        self._label_job = None
+        self._label_time = time.monotonic()
+        pending, self._label_pending = self._label_pending, {}
+        
+        for name, value in pending.items():
+            #o Scale chama o command a cada pixel do arraste com valores como "10.0000012";
+            #o label so muda quando o inteiro muda
+            if self._shown_labels.get(name) == value:
+                continue
+            self._shown_labels[name] = value
+            configure, text_format = self._scale_labels[name]
+            configure(text=text_format % value)
         
     def on_acceleration_change(self):
         """Callback para mudanca na aceleracao"""
@@ -735,163 +1278,238 @@ Seguranca:
         
     def on_dclick_change(self, value):
         """Callback para mudanca na velocidade do dublo clique"""
-        speed = int(float(value))
-        self.dclick_label.config(text=f"{speed} ms")
+        self._set_scale_label('double_click_speed', int(float(value)))
         
     def on_button_swap_change(self):
         """Callback para mudanca na troca de botoes"""
-        self.log_message(f"Botoes {'trocados' if self.swap_buttons_vat.get() else 'normais'}")
+        self.log_message(f"Botoes {'trocados' if self.swap_buttons_var.get() else 'normais'}")
         
     def on_wheel_change(self, value):
         """Callback para mudanca nas linhas de scroll"""
-        lines = int(float(value))
-        self.wheel_label.config(text=str(lines))
+        self._set_scale_label('wheel_scroll_lines', int(float(value)))
         
     def on_hover_change(self, value):
         """Callback para mudanca no tempo de hover"""
-        time_ms = int(float(value))
-        self.hover_label.config(text=f"{time_ms} ms")
-    
-    def on_settings_change(self, *args):
-        """Callback generico para mudancas nas configuracoes"""
-        #usar futuramente para auto-aplicar configuracoes
-        pass
+        self._set_scale_label('hover_time', int(float(value)))
     
+    def on_settings_change(self, varname, *args):
+        """Trace das variaveis: marca o campo como alterado e ainda nao aplicado"""
+        if self._suppress_trace:
+            return
+        
+        #so marca o campo: a gravacao no Windows fica para o botao "Aplicar"
+        self._pending_changes.add(self._trace_fields[varname][0])
+        
+    def _unsaved_fields(self) -> Dict[str, int]:
+        """Campos marcados cujo valor na interface difere do que esta no Windows"""
+        changes = {}
+        for name in self._pending_changes:
+            try:
+                value = int(self._field_vars[name].get())
+            except (tk.TclError, ValueError):
+                continue
+            if self._last_written.get(name) != value:
+                changes[name] = value
+        return changes
+        
+    def _settings_from_form(self) -> MouseSettings:
+        """Monta as configuracoes da interface (thread do tk)"""
+        #lidas do worker, cada variavel esperaria uma volta do loop do tk
+        accel = bool(self.accel_var.get())
+        return MouseSettings(
+            speed=self.speed_var.get(),
+            acceleration_enable=accel,
+            **self.ACCEL_PARAMS[accel],
+            double_click_speed=self.dclick_var.get(),
+            swap_buttons=self.swap_buttons_var.get(),
+            wheel_scroll_lines=self.wheel_lines_var.get(),
+            hover_time=self.hover_time_var.get(),
+            drag_width=4, #valor padrao
+            drag_height=4
+        )
+        
     #metodos de acao
     def apply_settings(self):
         """Aplica as confoiguracoes selecionadas"""
+        #montadas aqui na thread do tk; o worker so faz as chamadas ao Windows
+        new_settings = self._settings_from_form()
+        
         def apply_in_thread():
             try:
-                self.status_var.set("Aplicando configuracoes...")
+                self._result_q.put(('status', "Aplicando configuracoes..."))
                 
-                #cria objeto com as configuracoes atuais da interface
-                new_settings = MouseSettings(
-                    speed=self.speed_var.get(),
-                    acceleration_enable=self.accel_var.get(),
-                    acceleration_threshold1=6 if self.accel_var.get() else 0,
-                    acceleration_threshold2=10 if self.accel_var.get() else 0,
-                    acceleration_factor=1 if self.accel_var.get() else 0,
-                    double_click_speed=self.dclick_var.get(),
-                    swap_buttons=self.swap_buttons_var.get(),
-                    wheel_scroll_lines=self.wheel_lines_var.get(),
-                    hover_time=self.hover_time_vat.get(),
-                    drag_width=4, #valor padrao
-                    drag_height=4
-                )
-                
-                #aplica as configs
+                #aplica as configs (SystemMouseSettings so grava os campos que diferem)
                 results = self.system_settings.apply_settings(new_settings)
                 
                 #verifica resultados
-                success_count = sum(1 for success in results.value() if success)
+                success_count = sum(1 for success in results.values() if success)
                 total_count = len(results)
                 
                 if success_count == total_count:
+                    self._run_on_tk(self._remember_written, new_settings)
                     message = "Todas as configuracoes foram aplicadas com sucesso."
-                    self.root.after(0, lambda: messagebox.showinfo("Sucesso", message))
-                    self.root.after(0, lambda: self.status_var.set("Configuracoes aplicadas com sucesso."))
+                    self._run_on_tk(lambda: messagebox.showinfo("Sucesso", message))
+                    self._result_q.put(('status', "Configuracoes aplicadas com sucesso."))
                     self.log_message("Configuracoes aplicadas com sucesso.", "INFO")
                 else:
                     failed = [key for key, success in results.items() if not success]
                     message = f"Algumas configuracoes falharam: {', '.join(failed)}"
-                    self.root.after(0, lambda: messagebox.showwarning("Aviso", message))
-                    self.root.after(0, lambda: self.status_var.set("Aplicacao parcial"))
+                    self._run_on_tk(lambda: messagebox.showwarning("Aviso", message))
+                    self._result_q.put(('status', "Aplicacao parcial"))
                     self.log_message(f"Aplicacaoo parcial: {message}", "WARNING")
                     
             except Exception as e:
                 error_msg = f"Erro ao aplicar onfiguracoes: {e}"
-                self.root.after(0, lambda: messagebox.showerror("Erro", error_msg))
-                self.root.after(0, lambda: self.status_var.set("erro na aplicacao"))
+                self._run_on_tk(lambda: messagebox.showerror("Erro", error_msg))
+                self._result_q.put(('status', "erro na aplicacao"))
                 self.log_message(error_msg, "ERROR")
                 
-        threading.Thread(target=apply_in_thread, daemon=True).start()
+            finally:
+                self._run_on_tk(self.apply_button.state, ['!disabled'])
+                
+        #cliques repetidos enquanto a aplicacao anterior esta na fila do worker
+        #nao empilham outras gravacoes: o botao volta quando ela termina
+        self.apply_button.state(['disabled'])
+        self._run_in_pool(apply_in_thread)
         
     def restore_defaults(self):
         """Restaura configuracoes padrao"""
         if messagebox.askyesno("Confirmar", "Deseja restaurar todas as configuracoes para os valores padrao?"):
             def restore_in_thread():
                 try:
-                    self.status_var.set("Restaurando padroes...")
+                    self._result_q.put(('status', "Restaurando padroes..."))
                     
                     results = self.system_settings.restore_defaults()
                     success_count = sum(1 for success in results.values() if success)
                     
                     if success_count > 0:
-                        self.root.after(0, self.load_current_settings)
-                        self.root.after(0, lambda: messagebox.showinfo("Sucesso", "Configuracoes padrao restauradas!"))
+                        self._run_on_tk(self.load_current_settings)
+                        self._run_on_tk(lambda: messagebox.showinfo("Sucesso", "Configuracoes padrao restauradas!"))
                         self.log_message("COnfiguracoes padrao restauradas")
                     else:
-                        self.root.after(0, lambda: messagebox.showerror("Erro", "Falha ao restaurar configuracoes padrao"))
+                        self._run_on_tk(lambda: messagebox.showerror("Erro", "Falha ao restaurar configuracoes padrao"))
                         self.log_message("Falha ao restaurar configuracoes padrao", "ERROR")
                         
                 except Exception as e:
                     error_msg = f"Erro ao restaurar configuracoes: {e}"
-                    self.root.after(0, lambda: messagebox.showerror("Erro", error_msg))
+                    self._run_on_tk(lambda: messagebox.showerror("Erro", error_msg))
                     self.log_message(error_msg, "ERROR")
                     
-            threading.Thread(target=restore_in_thread, daemon=True).start()
+            self._run_in_pool(restore_in_thread)
             
     def create_backup(self):
         """Cria um backup das confoiguracoes atuais"""
-        try:
-            self.settings_backup = self.system_settings.backup_settings()
-            messagebox.showinfo("Backup", "BAckup das configuracoes criado com sucesso!")
-            self.log_message("Backup das configuracoes criado")
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro ao criar backup:\n{e}")
-            self.log_message(f"Erro ao criar backup: {e}", "ERROR")
+        #leitura e gravacao no pool, como a restauracao; so o resultado volta ao Tk
+        def backup_in_thread():
+            try:
+                backup = self.system_settings.backup_settings()
+                self._save_backup_file(backup)
+                self._run_on_tk(self._on_backup_created, backup)
+                self.log_message("Backup das configuracoes criado")
+            except Exception as e:
+                error_msg = f"Erro ao criar backup:\n{e}"
+                self._run_on_tk(lambda: messagebox.showerror("Erro", error_msg))
+                self.log_message(f"Erro ao criar backup: {e}", "ERROR")
+                
+        self._run_in_pool(backup_in_thread)
+        
+    def _on_backup_created(self, backup: MouseSettings):
+        """Guarda o backup recem-gravado e avisa o usuario (thread do Tk)"""
+        self.settings_backup = backup
+        messagebox.showinfo("Backup", "BAckup das configuracoes criado com sucesso!")
             
     def restore_backup(self):
         """Restaura configuracoes a partir do backup"""
-        if not self.settings_backup:
-            messagebox.showwarning("Aviso", "nenhum backup disponivel. Crie um backup antes de utilizar essa funcao")
-            return
-        
-        if messagebox.messagebox.askyesno("Confirmar", "Deseja resturar as configuracoes do backup?"):
+        if messagebox.askyesno("Confirmar", "Deseja resturar as configuracoes do backup?"):
+            backup = self.settings_backup
+            
             def restore_in_thread():
                 try:
-                    self.status_var.set("restaurando backup...")
+                    #backup de uma execucao anterior: lido do disco aqui no pool
+                    loaded = backup
+                    if loaded is None:
+                        loaded = self._load_backup_file()
+                        if loaded is None:
+                            self._run_on_tk(lambda: messagebox.showwarning("Aviso", "nenhum backup disponivel. Crie um backup antes de utilizar essa funcao"))
+                            return
+                        self._run_on_tk(self._remember_backup, loaded)
+                        
+                    self._result_q.put(('status', "restaurando backup..."))
                     
-                    results = self.system_settings.restore_from_backup(self.settings_backup)
+                    results = self.system_settings.restore_from_backup(loaded)
                     success_count = sum(1 for success in results.values() if success)
                     
-                    if success_count > 0:
-                        self.root.after(0, self.load_current_settings)
-                        self.root.after(0, lambda: messagebox.showinfo("sucesso", "Backup restaurado com sucesso!"))
+                    #dict vazio: o backup ja e a configuracao atual, nada foi gravado
+                    if not results:
+                        self._run_on_tk(lambda: messagebox.showinfo("Backup", "As configuracoes atuais ja sao iguais ao backup"))
+                        self.log_message("Backup ja corresponde as configuracoes atuais")
+                    elif success_count > 0:
+                        self._run_on_tk(self.load_current_settings)
+                        self._run_on_tk(lambda: messagebox.showinfo("sucesso", "Backup restaurado com sucesso!"))
                         self.log_message("Backup restaurado com sucesso")
                     else:
-                        self.root.after(0, lambda: messagebox.showerror("Erro", "falha ao restaurar backup"))
+                        self._run_on_tk(lambda: messagebox.showerror("Erro", "falha ao restaurar backup"))
                         self.log_message("falha ao restaurar backup", "ERROR")
                     
                 except Exception as e:
                     error_msg = f"Erro ao restaurar backup: {e}"
-                    self.root.after(0, lambda: messagebox.showerror("Erro", error_msg))
+                    self._run_on_tk(lambda: messagebox.showerror("Erro", error_msg))
                     self.log_message(error_msg, "ERROR")
                     
-            threading.Thread(target=restore_in_thread, daemon=True).start()
+            self._run_in_pool(restore_in_thread)
+            
+    def _remember_backup(self, backup: MouseSettings):
+        """Guarda o backup lido do disco, se nenhum mais novo foi criado (thread do tk)"""
+        if self.settings_backup is None:
+            self.settings_backup = backup
+            
+    def _save_backup_file(self, settings: MouseSettings):
+        """Grava o backup com escrita atomica (arquivo temporario + os.replace)"""
+        tmp_path = _BACKUP_PATH + '.tmp'
+        os.makedirs(os.path.dirname(_BACKUP_PATH), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(_fields_dict(settings), f)
+        os.replace(tmp_path, _BACKUP_PATH)
+        
+    def _load_backup_file(self) -> Optional[MouseSettings]:
+        """Le o backup gravado por _save_backup_file, se existir"""
+        if not os.path.exists(_BACKUP_PATH):
+            return None
+        try:
+            with open(_BACKUP_PATH, 'rb') as f:
+                return MouseSettings(**pickle.load(f))
+        except Exception as e:
+            self.log_message(f"Erro ao ler backup salvo: {e}", "ERROR")
+            return None
             
     #metodos utilitarios
     def set_acceleration_level(self, level: MouseAcceleration):
         """Define o nivel de aceleracao"""
-        try:
-            self.accel_var.set(True)
-            success = self.system_settings.enable_mouse_acceleration(level)
-            
-            if success:
-                self.load_current_settings()
-                level_names = {MouseAcceleration.LOW: "Baixo", MouseAcceleration.MEDIUM: "Médio", MouseAcceleration.HIGH: "Alto"}
-                self.log_message(f"Aceleracao definida para nivel {level_names.get(level, 'Desconhecido')}")
-            else:
-                messagebox.showerror("Erro", "Falha ao definir o nível de aceleração")
+        self.accel_var.set(True)
+        level_name = self.ACCEL_LEVEL_NAMES.get(level, 'Desconhecido')
+        
+        #a gravacao vai pelo pool, em ordem com aplicar/restaurar/backup
+        def accel_in_thread():
+            try:
+                success = self.system_settings.enable_mouse_acceleration(level)
                 
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro ao definir o nível de aceleração:\n{e}")
-            self.log_message(f"Erro ao definir o nível de aceleração: {e}", "ERROR")
+                if success:
+                    self._run_on_tk(self.load_current_settings)
+                    self.log_message(f"Aceleracao definida para nivel {level_name}")
+                else:
+                    self._run_on_tk(lambda: messagebox.showerror("Erro", "Falha ao definir o nível de aceleração"))
+                    
+            except Exception as e:
+                error_msg = f"Erro ao definir o nível de aceleração:\n{e}"
+                self._run_on_tk(lambda: messagebox.showerror("Erro", error_msg))
+                self.log_message(f"Erro ao definir o nível de aceleração: {e}", "ERROR")
+                
+        self._run_in_pool(accel_in_thread)
     
     def test_double_click(self):
         """Testa a velocidade do duplo clique"""
         messagebox.showinfo("Teste de Duplo CLique",
-                            f"Velocidade atual: {self.dclick_vat.set()}ms\n\n"
+                            f"Velocidade atual: {self.dclick_var.get()}ms\n\n"
                             "Teste fazendo duplo clique em qualquer lugar da interface.\n"
                             "Se for muito lento ou rapido, ajuste o valor e aplique.")
         
@@ -900,11 +1518,10 @@ Seguranca:
         try:
             summary = self.system_settings.get_settings_summary()
             
-            summary_text = "Resumo das configuracoes atuais:\n\n"
-            for key, value in summary.items():
-                key_formatted = key.replace('_', '').title()
-                summary_text += f"{key_formatted}: {value}\n"
-                
+            summary_text = "Resumo das configuracoes atuais:\n\n" + "".join(
+                f"{key.replace('_', '').title()}: {value}\n" for key, value in summary.items()
+            )
+            
             messagebox.showinfo("Resumo das Configurações", summary_text)
             
         except Exception as e:
@@ -912,52 +1529,64 @@ Seguranca:
             
     def refresh_all_data(self):
         """Atualiza todos os dados da aplicacao"""
-        self.status_var.set("Atualizando todos os dados...")
+        self._set_status("Atualizando todos os dados...")
         self.load_current_settings()
         self.refresh_mice_list()
-        self.load_system_info()
+        if "Avancado" in self._tab_built:
+            self.load_system_info()
         self.log_message("Todos os dados foram atualizados")
         
     #metodos da aba avancada
-    def load_system_info(self):
-        """Carrega informacoes do sistema"""
+    def load_system_info(self, reload: bool = False):
+        """Carrega informacoes do sistema (reload descarta o cache do SystemMouseSettings)"""
         def load_in_thread():
             try:
+                if reload:
+                    self.system_settings.invalidate_system_info()
                 system_info = self.system_settings.get_system_info()
                 
-                info_text = "Informacoes do Sistema:\n\n"
+                #o texto inteiro e montado aqui; a thread do tk so faz um insert
+                lines = ["Informacoes do Sistema:", ""]
                 
                 if 'windows_version' in system_info:
                     version = system_info['windows_version']
-                    info_text += f"Windows: {version.major}.{version.minor} Build {version.build}\n"
+                    lines.append(f"Windows: {version.major}.{version.minor} Build {version.build}")
                     
-                info_text += f"Privilegios Admin: {'Necessarios' if system_info.get('admin_required', True) else 'Nao necessario'}\n"
-                info_text += f"Suporte Troca Botoes: {'Sim' if system_info.get('swap_button_support', False) else 'Nao'}\n"
-                info_text += f"DPI Aware: {'Sim' if system_info.get('system_dpi_aware', False) else 'Nao'}\n"
+                lines.append(f"Privilegios Admin: {'Necessarios' if system_info.get('admin_required', True) else 'Nao necessario'}")
+                lines.append(f"Suporte Troca Botoes: {'Sim' if system_info.get('swap_button_support', False) else 'Nao'}")
+                lines.append(f"DPI Aware: {'Sim' if system_info.get('system_dpi_aware', False) else 'Nao'}")
                 
                 if 'double_click_area' in system_info:
                     area = system_info['double_click_area']
-                    info_text += f"Area Duplo Clique: {area[0]}x{area[1]}pixels\n"
+                    lines.append(f"Area Duplo Clique: {area[0]}x{area[1]}pixels")
                     
-                self.root.after(0, lambda: self._update_system_info_display(info_text))
+                self._run_on_tk(self._update_system_info_display, '\n'.join(lines) + '\n')
                 
             except Exception as e:
                 error_text = f"Erro ao carregar informacoes do sistema:\n{e}"
-                self.root.after(0, lambda: self._update_system_info_display(error_text))
+                self._run_on_tk(self._update_system_info_display, error_text)
                 self.log_message(error_text, "ERROR")
                 
-        threading.Thread(target=load_in_thread, daemon=True).start()
+        self._run_in_pool(load_in_thread)
         
     def _update_system_info_display(self, text: str):
         """Atualiza a exibicao das informacoes do sistema"""
-        self.system_info_text.delete(1.0, tk.END)
-        self.system_info_text.insert(1.0, text)
+        self._system_info_display = text
+        if "Avancado" not in self._tab_built:
+            return
+        
+        #somente leitura entre as atualizacoes, como o painel de detalhes
+        widget = self.system_info_text
+        widget.configure(state=tk.NORMAL)
+        widget.delete('1.0', tk.END)
+        widget.insert('1.0', text)
+        widget.configure(state=tk.DISABLED)
         
     def run_system_check(self):
         """Executa verificacao do sistema"""
         def check_in_thread():
             try:
-                self.status_var.set("Executando verificação do sistema...")
+                self._result_q.put(('status', "Executando verificação do sistema..."))
                 
                 check_results = []
                 
@@ -978,15 +1607,15 @@ Seguranca:
                 
                 result_text = "Verificacao do Sistema:\n\n" + "\n".join(check_results)
                 
-                self.root.after(0, lambda: messagebox.showinfo("Verificacao do Sistema", result_text))
-                self.root.after(0, lambda: self.status_var.set("verificacao concluida"))
+                self._run_on_tk(lambda: messagebox.showinfo("Verificacao do Sistema", result_text))
+                self._result_q.put(('status', "verificacao concluida"))
                 
             except Exception as e:
                 error_msg = f"Erro na verificacao: {e}"
-                self.root.after(0, lambda: messagebox.showerror("Erro", error_msg))
+                self._run_on_tk(lambda: messagebox.showerror("Erro", error_msg))
                 self.log_message(error_msg, "ERROR")
                 
-        threading.Thread(target=check_in_thread, daemon=True).start()
+        self._run_in_pool(check_in_thread)
         
     def show_hid_stats(self):
         """Mostra estatisticas do dispositivos HID"""
@@ -1013,17 +1642,16 @@ Cache Ativo: {'Sim' if hasattr(self.mouse_detector, '_cache_valid') else 'Não'}
         """Executa testes de performance"""
         def test_in_thread():
             try:
-                self.status_var.get("executando teste de performance...")
+                self._result_q.put(('status', "executando teste de performance..."))
                 
-                #teste de deteccao
-                start_time = time.time()
-                self.mouse_detector.get_connected_mice(force_refresh=True)
-                detection_time = time.time() - start_time
+                #teste de deteccao: varredura forcada (enumeracao fria) feita pela
+                #propria thread de deteccao; o resultado novo vai para a lista
+                detection_time = self._timed_scan()
                 
-                #teste de configuracoes
-                start_time = time.time()
-                self.system_settings.get_current_settings()
-                settings_time = time.time() - start_time
+                #teste de configuracoes: leitura do Windows, sem o cache
+                start_time = time.perf_counter()
+                self.system_settings.get_current_settings(refresh=True)
+                settings_time = time.perf_counter() - start_time
                 
                 results = f"""Teste de Performance:
 
@@ -1033,43 +1661,60 @@ Carregamento de Configurações: {settings_time:.3f}s
 Performance: {'Excelente' if detection_time < 0.5 else 'Boa' if detection_time < 1.0 else 'Lenta'}
 """
 
-                self.root.after(0, lambda: messagebox.showinfo("teste de performance", results))
-                self.root.after(0, lambda: self.status_var.set("Teste concluido"))
+                self._run_on_tk(lambda: messagebox.showinfo("teste de performance", results))
+                self._result_q.put(('status', "Teste concluido"))
                 
             except Exception as e:
                 error_msg = f"Erro durante o teste de performance: {e}"
-                self.root.after(0, lambda: messagebox.showerror("Erro", error_msg))
-                self.log_message(f"error_msg, {e}")
+                self._run_on_tk(lambda: messagebox.showerror("Erro", error_msg))
+                self.log_message(error_msg, "ERROR")
                 
-        threading.Thread(target=test_in_thread, daemon=True).start()
+        self._run_in_pool(test_in_thread)
         
     #metodos de log e utilitarios
     def log_message(self, message: str, level: str = "INFO"):
         """Adiciona mensagem ao log"""
+        #pode ser chamado de qualquer thread: so enfileira; o widget e escrito
+        #por _flush_log na thread do tk
+        timestamp = time.strftime('%H:%M:%S')
+        self._log_pending.append(f"[{timestamp}] {level}: {message}\n")
+        
+    def _flush_log(self):
+        """Escreve as entradas pendentes no log com um unico insert (thread do tk)"""
+        #aba avancada ainda nao montada: as entradas esperam no anel
+        if not self._log_pending or "Avancado" not in self._tab_built:
+            return
+        
         try:
-            timestamp = time.strtime('%H:%M:%S')
-            log_entry = f"[{timestamp}] {level}: {message}\n"
+            pending = self._log_pending
+            entries = [pending.popleft() for _ in range(len(pending))]
+            self._log_lines.extend(entries)
             
-            self.log_text.insert(tk.END, log_entry)
-            self.log_text.see(tk.END)
+            text = self.log_text
+            text.configure(state=tk.NORMAL)
+            text.insert(tk.END, ''.join(entries))
+            #limita o tamanho do log sem ler o conteudo de volta do widget
+            text.delete('1.0', f'end-{self.LOG_MAX_LINES + 1}l')
+            text.configure(state=tk.DISABLED)
+            text.see(tk.END)
             
-            #limite o tamanho do log
-            lines = self.log_text.delete(1.0, f"{len(lines)-500}.0")
-            if len(lines) > 1000:
-                self.log_text.delete(1.0, f"{len(lines)-500}.0")
-            
-        except Exception:
-            pass #isso teoricamente vai evitar loops de erro no log (euespero)
+        except tk.TclError:
+            pass #widget ja destruido (fechando a janela)
         
     def clear_log(self):
         """Limpa o log"""
+        #descarta tambem o que ainda nao foi escrito, senao reaparece no proximo flush
+        self._log_pending.clear()
+        self._log_lines.clear()
+        self.log_text.configure(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
+        self.log_text.configure(state=tk.DISABLED)
         self.log_message("Log limpo")
         
     def save_log(self):
         """salva o log em arquivo"""
         try:
-            from tktinter import filedialog
+            from tkinter import filedialog
             
             filename = filedialog.asksaveasfilename(
                 defaultextension=".txt", 
@@ -1077,15 +1722,29 @@ Performance: {'Excelente' if detection_time < 0.5 else 'Boa' if detection_time <
                 title="Salvar Log"
             )
             
-            if filename:
+            if not filename:
+                return
+            
+            #copia rasa das linhas (nada e lido do widget nem concatenado aqui)
+            self._flush_log()
+            lines = list(self._log_lines)
+            
+        except Exception as e:
+            messagebox.showerror("Erro", f"Falha ao salvar o log:\n{e}")
+            return
+        
+        def save_in_thread():
+            try:
                 with open(filename, 'w', encoding='utf-8') as f:
-                    filename.write(self.log_text.get(1.0, tk.END))
+                    f.writelines(lines)
                     
-                messagebox.showinfo("Sucesso", f"Log salvo em:\n{filename}")
+                self._run_on_tk(messagebox.showinfo, "Sucesso", f"Log salvo em:\n{filename}")
                 self.log_message(f"Log salvo em: {filename}")
                 
-        except Exception as e:
-            messagebox.showerror("Erro", f"Falha ao salvar o log:\n{e}")
+            except Exception as e:
+                self._run_on_tk(messagebox.showerror, "Erro", f"Falha ao salvar o log:\n{e}")
+                
+        self._run_in_pool(save_in_thread)
             
     #metodos de exportacao e detlahes
     def show_detailed_info(self):
@@ -1097,46 +1756,62 @@ Performance: {'Excelente' if detection_time < 0.5 else 'Boa' if detection_time <
                 messagebox.showinfo("Informacao", "Nenhum mouse detectado.")
                 return
             
-            #cria janela de detalhes
-            detail_window = tk.Toplevel(self.root)
-            detail_window.title("Informacoes detalhadas dos Mouses")
-            detail_window.geometry("800x600")
-            
-            #texto com scroll
-            text_widget = scrolledtext.ScrolledText(detail_window, wrap=tk.WORD, font=('Consolas', 9))
-            text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            #gera texto detalhado
-            detailed_text = "🖱️ INFORMAÇÕES DETALHADAS DOS MOUSES\n"
-            detailed_text += "=" * 80 + "\n\n"
+            #a janela de detalhes e criada uma vez e reaproveitada ate ser fechada
+            if self._detail_window is None:
+                detail_window = tk.Toplevel(self.root)
+                detail_window.title("Informacoes detalhadas dos Mouses")
+                detail_window.geometry("800x600")
+                detail_window.bind('<Destroy>', self._on_detail_window_destroy)
+                
+                #texto com scroll
+                self._detail_text = self._scrolled_text(detail_window, padding=10, font='MMMono')
+                self._detail_window = detail_window
+            else:
+                self._detail_window.deiconify()
+                self._detail_window.lift()
+                
+            #gera texto detalhado (partes unidas uma vez no final)
+            parts = ["🖱️ INFORMAÇÕES DETALHADAS DOS MOUSES\n", "=" * 80 + "\n\n"]
             
             for i, mouse in enumerate(mice, 1):
-                detailed_text += f"MOUSE {i}:\n"
-                detailed_text += f"  Nome: {mouse.name}\n"
-                detailed_text += f"  Fabricante: {mouse.manufacturer}\n"
-                detailed_text += f"  Vendor ID: {mouse.vendor_id}\n"
-                detailed_text += f"  Product ID: {mouse.product_id}\n"
-                detailed_text += f"  Conexão: {mouse.connection_type}\n"
-                detailed_text += f"  Serial: {mouse.serial_number}\n"
-                detailed_text += f"  Release: {mouse.release_number}\n"
-                detailed_text += f"  Interface: {mouse.interface_number}\n"
-                detailed_text += f"  Usage Page: {mouse.usage_page}\n"
-                detailed_text += f"  Usage: {mouse.usage}\n"
-                detailed_text += f"  Path: {mouse.path}\n"
-                detailed_text += "-" * 80 + "\n\n"
+                parts.append(
+                    f"MOUSE {i}:\n"
+                    f"  Nome: {mouse.name}\n"
+                    f"  Fabricante: {mouse.manufacturer}\n"
+                    f"  Vendor ID: {mouse.vendor_id}\n"
+                    f"  Product ID: {mouse.product_id}\n"
+                    f"  Conexão: {mouse.connection_type}\n"
+                    f"  Serial: {mouse.serial_number}\n"
+                    f"  Release: {mouse.release_number}\n"
+                    f"  Interface: {mouse.interface_number}\n"
+                    f"  Usage Page: {mouse.usage_page}\n"
+                    f"  Usage: {mouse.usage}\n"
+                    f"  Path: {mouse.path}\n"
+                    + "-" * 80 + "\n\n"
+                )
                 
-            text_widget.insert(1.0, detailed_text)
+            text_widget = self._detail_text
+            text_widget.delete('1.0', tk.END)
+            text_widget.insert('1.0', ''.join(parts))
             
         except Exception as e:
             messagebox.showerror("Erro", f"Ocorreu um erro ao exibir informações detalhadas:\n{e}")
             
+    def _on_detail_window_destroy(self, event):
+        """Janela de detalhes fechada: a proxima chamada cria outra"""
+        #<Destroy> tambem chega dos widgets filhos; so interessa a propria janela
+        if event.widget is self._detail_window:
+            self._detail_window = None
+            self._detail_text = None
+            
     def export_mice_info(self):
         """Exporta informacoes dos mouses para arquivos"""
         try:
             from tkinter import filedialog
             import json
             
-            mice = self.mouse_detector.mice_info
+            #copia: o worker serializa enquanto a deteccao pode trocar a lista
+            mice = list(self.mouse_detector.mice_info)
             
             if not mice:
                 messagebox.showinfo("Informacao", "Nenhum mouse para exportar.")
@@ -1148,53 +1823,218 @@ Performance: {'Excelente' if detection_time < 0.5 else 'Boa' if detection_time <
                 title="Exportar Informacoes dos Mouses"
             )
             
-            if filename:
-                #converte para dicionario (json)
-                mice_data = [asdict(mouse) for mouse in mice]
-                
+            if not filename:
+                return
+            
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao exportar:\n{e}")
+            return
+        
+        #serializacao e escrita no worker; o dialogo de resultado volta para o tk
+        def export_in_thread():
+            try:
                 if filename.endswith('.json'):
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(mice_data, f, indent=2, ensure_ascii=False)
+                    #converte para dicionario (json)
+                    mice_data = [_fields_dict(mouse) for mouse in mice]
+                    content = json.dumps(mice_data, indent=2, ensure_ascii=False)
                 else:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        for mouse in mice:
-                            f.write(f"Nome: {mouse.name}\n")
-                            f.write(f"Fabricante: {mouse.manufacturer}\n")
-                            f.write(f"VID: {mouse.vid}\n")
-                            f.write(f"PID: {mouse.pid}\n")
-                            f.write(f"Conexao: {mouse.connection_type}\n")
-                            f.write(f"Serial: {mouse.serial_number}\n")
-                            f.write("-" * 50 + "\n")
-                            
-                messagebox.showinfo("Sucesso", f"Informacoes exportadas para:\n{filename}")
+                    lines = []
+                    for mouse in mice:
+                        lines.append(f"Nome: {mouse.name}")
+                        lines.append(f"Fabricante: {mouse.manufacturer}")
+                        lines.append(f"VID: {mouse.vendor_id}")
+                        lines.append(f"PID: {mouse.product_id}")
+                        lines.append(f"Conexao: {mouse.connection_type}")
+                        lines.append(f"Serial: {mouse.serial_number}")
+                        lines.append("-" * 50)
+                    content = "\n".join(lines) + "\n"
+                    
+                with open(filename, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                    
+                self._run_on_tk(messagebox.showinfo, "Sucesso", f"Informacoes exportadas para:\n{filename}")
                 self.log_message(f"Informacoes exportadas para: {filename}")
                 
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro ao exportar:\n{e}")
+            except Exception as e:
+                self._run_on_tk(messagebox.showerror, "Erro", f"Erro ao exportar:\n{e}")
+                
+        self._run_in_pool(export_in_thread)
             
     def sort_treeview(self, column):
         """Ordena o treeview por coluna"""
         try:
-            items = [(self.mice_tree.set(item, column), item) for item in self.mice_tree.get_children('')]
-            item.sort()
+            #segundo clique na mesma coluna inverte a ordem
+            index = self._tree_columns.index(column)
+            self._sort_by = (index, self._sort_by == (index, False))
+            
+            #os valores ja estao em _row_by_key: nenhuma leitura do Tcl e um unico set_children
+            order = self._ordered_iids(list(self._row_by_key.values()))
+            self.mice_tree.set_children('', *order)
+            self._row_order = order
             
-            for index, (val, item) in enumerate(items):
-                self.mice_tree.move(item, '', index)
-                
         except Exception as e:
             self.log_message(f"Erro ao ordenar o treeview: {e}", "ERROR")
             
+    def _ordered_iids(self, rows: List[tuple]) -> tuple:
+        """iids das linhas (iid, valores) na ordem da coluna escolhida, se houver"""
+        if self._sort_by is not None:
+            index, reverse = self._sort_by
+            rows = sorted(rows, key=lambda row: _sort_keys(row[1])[index], reverse=reverse)
+        return tuple(row[0] for row in rows)
+        
+    #eventos do sistema
+    def setup_system_events(self):
+        """Liga as mensagens do Windows a eventos virtuais do tk"""
+        self.root.bind("<<MouseChanged>>", self.on_mice_changed)
+        self.root.bind("<<SettingsChanged>>", self.on_system_settings_changed)
+        
+        devices_ok = system_events.subscribe(system_events.WM_DEVICECHANGE,
+                                             self._on_device_change_message)
+        settings_ok = system_events.subscribe(system_events.WM_SETTINGCHANGE,
+                                              self._on_setting_change_message)
+        self.system_events_active = devices_ok and settings_ok
+        
+    def _on_device_change_message(self, wparam, lparam):
+        """WM_DEVICECHANGE (thread de eventos do sistema)"""
+        self._post_system_event("<<MouseChanged>>")
+        
+    def _on_setting_change_message(self, wparam, lparam):
+        """WM_SETTINGCHANGE (thread de eventos do sistema)"""
+        self._post_system_event("<<SettingsChanged>>")
+        
+    def _post_system_event(self, sequence: str):
+        """Repassa um evento para o loop do tk, agrupando rajadas do mesmo evento"""
+        if sequence in self._pending_system_events:
+            return
+        self._pending_system_events.add(sequence)
+        
+        #pela fila de resultados: a thread da janela de eventos nunca espera o tk
+        #(ex.: durante um broadcast) e o evento e gerado na thread do tk
+        self._run_on_tk(self.root.event_generate, sequence, when='tail')
+        
+    def on_mice_changed(self, event=None):
+        """Um dispositivo foi conectado ou removido"""
+        self._pending_system_events.discard("<<MouseChanged>>")
+        #minimizada: _on_show faz a atualizacao quando a janela voltar
+        if not self.auto_refresh_enable.get() or self._paused:
+            return
+        
+        #cada evento da rajada adia a varredura; ela so sai quando o barramento acalma
+        if self._device_event_job:
+            self.root.after_cancel(self._device_event_job)
+        self._device_event_job = self.root.after(self.device_event_delay, self._on_devices_settled)
+        
+    def _on_devices_settled(self):
+        """Fim de uma rajada de eventos de dispositivo: uma unica re-enumeracao"""
+        self._device_event_job = None
+        self.refresh_mice_list()
+            
+    def on_system_settings_changed(self, event=None):
+        """As configuracoes do Windows foram alteradas (por nos ou por outro programa)"""
+        self._pending_system_events.discard("<<SettingsChanged>>")
+        if self.auto_refresh_enable.get() and not self._paused:
+            self.load_current_settings()
+            
     #Auto-refresh
     def start_auto_refresh(self):
         """Inicia o refresh automático"""
-        if self.auto_refresh_enable.get():
+        if not self.auto_refresh_enable.get():
+            return
+        
+        if self.root.state() == 'iconic':
+            self._paused = True
+            return
+        
+        #no modo adaptativo os eventos do sistema substituem o polling;
+        #um intervalo fixo escolhido pelo usuario sempre faz polling
+        if self.system_events_active and self.REFRESH_MODES[self._mode.get()] is None:
+            return
+        
+        #o timer ja armado continua valendo; o prazo e conferido quando ele dispara
+        self._last_refresh = time.monotonic()
+        if not self.refresh_job:
             self.refresh_job = self.root.after(self.refresh_interval, self.auto_refresh_callback)
             
     def auto_refresh_callback(self):
         """Callback do refresh automatico"""
+        if not self.auto_refresh_enable.get():
+            self.refresh_job = None
+            return
+        
+        #o polling adaptativo pode ter alongado o intervalo depois que o timer foi
+        #armado; nesse caso so reagenda para o que falta, sem varrer
+        remaining = self.refresh_interval - (time.monotonic() - self._last_refresh) * 1000
+        if remaining > 1:
+            self.refresh_job = self.root.after(int(remaining), self.auto_refresh_callback)
+            return
+        
+        #ninguem esta vendo a lista: para o timer; _on_tab_changed retoma
+        if self._visible_tab != "Mouses Detectados":
+            self.refresh_job = None
+            self._tab_paused = True
+            return
+        
+        #ancora o ciclo no horario previsto, nao no atraso com que o after disparou,
+        #para a cadencia nao derivar; se ficou mais de um ciclo para tras
+        #(sistema ocupado, suspensao) recomeca a contar de agora
+        now = time.monotonic()
+        period = self.refresh_interval / 1000
+        due = self._last_refresh + period
+        self._last_refresh = due if now - due < period else now
+        
+        self.refresh_mice_list(force=False)
+        
+        delay = self.refresh_interval - (time.monotonic() - self._last_refresh) * 1000
+        self.refresh_job = self.root.after(max(0, int(delay)), self.auto_refresh_callback)
+            
+    def _track_mice_changes(self, changed: bool):
+        """Ajusta o intervalo do polling conforme a lista de mouses muda ou nao"""
+        if changed:
+            self._idle_streak = 0
+        else:
+            #limita o expoente; o intervalo ja satura em _max_interval
+            self._idle_streak = min(self._idle_streak + 1, 16)
+        
+        fixed = self.REFRESH_MODES[self._mode.get()]
+        if fixed is not None:
+            self.refresh_interval = fixed
+        else:
+            self.refresh_interval = min(self._max_interval,
+                                        self._min_interval * (2 ** self._idle_streak))
+            
+    def on_refresh_mode_change(self, event=None):
+        """Troca o modo do auto-refresh escolhido na toolbar"""
+        fixed = self.REFRESH_MODES[self._mode.get()]
+        self._idle_streak = 0
+        self.refresh_interval = fixed if fixed is not None else self._min_interval
+        
+        if self.refresh_job:
+            self.root.after_cancel(self.refresh_job)
+            self.refresh_job = None
+        self.start_auto_refresh()
+        self.log_message(f"Auto-refresh: {self._mode.get()}")
+            
+    def _on_hide(self, event):
+        """Janela minimizada: suspende o auto-refresh"""
+        #<Unmap> tambem chega dos widgets filhos; so interessa a janela principal
+        if event.widget is not self.root:
+            return
+        
+        if self.refresh_job:
+            self.root.after_cancel(self.refresh_job)
+            self.refresh_job = None
+        self._paused = True
+        
+    def _on_show(self, event):
+        """Janela restaurada: uma atualizacao imediata e retoma o auto-refresh"""
+        if event.widget is not self.root or not self._paused:
+            return
+        
+        self._paused = False
+        self._wake_pump()
         if self.auto_refresh_enable.get():
-            self.refresh_mice_list()
-            self.refresh_job = self.root.after(self.refresh_interval, self.auto_refresh_callback)
+            self.refresh_all_data()
+            self.start_auto_refresh()
             
     def toggle_auto_refresh(self):
         """Liga/desliga o refresh automático"""
@@ -1212,21 +2052,86 @@ Performance: {'Excelente' if detection_time < 0.5 else 'Boa' if detection_time <
         try:
             admin_required = self.system_settings.is_admin_required()
             if admin_required:
-                self.admin_label.config(text="Admin Req.", style='Warning.TLabel')
+                shown = ("Admin Req.", 'Warning.TLabel')
             else:
-                self.admin_label.config(text="Privilegios OK", style='Success.TLabel')
+                shown = ("Privilegios OK", 'Success.TLabel')
         except:
-            self.admin_label.config(text='Desconhecido', style='Error.TLabel')
+            shown = ('Desconhecido', 'Error.TLabel')
+            
+        #mesmo texto e estilo ja aplicados: nada de nova busca de estilo/redesenho
+        if shown == self._admin_shown:
+            return
+        self._admin_shown = shown
+        text, style = shown
+        self.admin_label.config(text=text, style=style)
+            
+    def has_unsaved_changes(self) -> bool:
+        """Indica se ha mudancas da interface ainda nao aplicadas no Windows"""
+        return bool(self._unsaved_fields())
+    
+    def save_all_settings(self):
+        """Aplica as mudancas ainda nao aplicadas e espera a gravacao (saida do app)"""
+        if not self.has_unsaved_changes():
+            return
+        try:
+            #pelo pool, depois de um "Aplicar" que ainda esteja na fila; a espera
+            #bloqueia o tk, mas o worker nao depende dele para terminar
+            settings = self._settings_from_form()
+            future = self._pool.submit(self.system_settings.apply_settings, settings)
+            results = future.result(timeout=30)
+            if all(results.values()):
+                self._remember_written(settings)
+                self._pending_changes.clear()
+            else:
+                failed = [key for key, success in results.items() if not success]
+                self.log_message(f"Falha ao gravar: {', '.join(failed)}", "WARNING")
+        except Exception as e:
+            self.log_message(f"Erro ao gravar configuracoes: {e}", "ERROR")
+        
+    def discard_pending_changes(self):
+        """Descarta as mudancas ainda nao aplicadas sem grava-las"""
+        self._pending_changes.clear()
+        
+    def cleanup(self):
+        """Libera os recursos da interface antes do destroy (a janela para de atualizar)"""
+        #cancela refresh automatico
+        if self.refresh_job:
+            self.root.after_cancel(self.refresh_job)
+            self.refresh_job = None
             
+        #atualizacoes de labels ainda agendadas nao tem mais para onde ir
+        for job in (self._label_job, self._status_job, self._device_event_job):
+            if job:
+                self.root.after_cancel(job)
+        self._label_job = self._status_job = self._device_event_job = None
+            
+        #encerra a thread de deteccao (uma varredura em andamento termina sozinha)
+        self._detect_stop.set()
+        self._scan_request.set()
+        
+        #arquiva os snapshots de backup da sessao
+        if hasattr(self, 'system_settings'):
+            self.system_settings.archive_snapshots()
+            
+        #leituras ainda na fila nao tem mais onde ser exibidas
+        self._pool.shutdown(wait=False)
+        
+        #salva log se necessario
+        self.log_message("Aplicacao encerrada")
+        
+        #tudo o que ainda esta agendado (fila, scroll, chamadas dos workers) sai
+        #aqui: quem chama cleanup (esta classe ou o MouseManagerApp) destroi a raiz
+        #em seguida e nenhum callback pode disparar num interpretador destruido
+        for job in self.root.tk.splitlist(self.root.tk.call('after', 'info')):
+            try:
+                self.root.after_cancel(job)
+            except tk.TclError:
+                pass
+                
     def on_closing(self):
         """Callback para fechamento da janela"""
         try:
-            #cancela refresh automatico
-            if self.refresh_job:
-                self.root.after_cancel(self.refresh_job)
-                
-            #salva log se necessario
-            self.log_message("Aplicacao encerrada")
+            self.cleanup()
             
             #fecha a janela
             self.root.destroy()